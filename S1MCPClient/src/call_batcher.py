@@ -0,0 +1,136 @@
+"""Coalescing of concurrent mod calls into batched round-trips."""
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+from .models.response import Response
+from .utils.logger import get_logger
+
+if TYPE_CHECKING:
+    from .tcp_client import TcpClient
+
+
+# Error code the mod returns for unknown methods (older mods have no "batch" method)
+METHOD_NOT_FOUND = -32601
+
+
+class McpCallBatcher:
+    """
+    Coalesce concurrent mod calls into batched round-trips.
+
+    A call made while nothing is in flight is sent right away as a plain
+    request, so serial callers pay no extra latency. Calls made while a previous
+    send is still in flight are queued and sent together as one "batch" request
+    once it finishes, or after max_wait, whichever comes first.
+    """
+
+    def __init__(self, tcp_client: "TcpClient", max_batch_size: int = 10, max_wait: float = 0.005):
+        """
+        Initialize the batcher.
+
+        Args:
+            tcp_client: TCP client used to reach the mod
+            max_batch_size: Maximum number of calls sent in one batch
+            max_wait: Most seconds a queued call waits for the in-flight send before its batch is sent
+        """
+        self.tcp_client = tcp_client
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.logger = get_logger()
+
+        self._pending: List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]] = []
+        self._flush_timer: Optional[asyncio.TimerHandle] = None
+        self._send_tasks: Set[asyncio.Task] = set()
+        self._batch_supported = True
+
+    async def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Response:
+        """
+        Call a method on the mod, sharing the round-trip with other pending calls.
+
+        Args:
+            method: Method name
+            params: Optional parameters
+
+        Returns:
+            Response object
+
+        Raises:
+            TcpConnectionError: If communication fails
+            ProtocolError: If protocol error occurs
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((method, params, future))
+
+        if not self._send_tasks or len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_timer is None:
+            self._flush_timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self) -> None:
+        """Send everything pending as one batch."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._send_tasks.add(task)
+        task.add_done_callback(self._send_done)
+
+    def _send_done(self, task: asyncio.Task) -> None:
+        """Send the calls queued behind a finished send without waiting out max_wait."""
+        self._send_tasks.discard(task)
+        if self._pending:
+            self._flush()
+
+    async def _send(self, batch: List[Tuple[str, Optional[Dict[str, Any]], asyncio.Future]]) -> None:
+        """Send a batch to the mod and resolve each caller's future."""
+        if len(batch) == 1 or not self._batch_supported:
+            for method, params, future in batch:
+                try:
+                    response = await asyncio.to_thread(self.tcp_client.call_with_retry, method, params)
+                except Exception as e:
+                    _resolve(future, exception=e)
+                else:
+                    _resolve(future, response)
+            return
+
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Sending batch of %d calls: %s", len(batch), [method for method, _, _ in batch])
+        try:
+            responses = await asyncio.to_thread(
+                self.tcp_client.call_batch,
+                [(method, params) for method, params, _ in batch]
+            )
+        except Exception as e:
+            for _, _, future in batch:
+                _resolve(future, exception=e)
+            return
+
+        first_error = responses[0].error if responses else None
+        if first_error is not None and first_error.code == METHOD_NOT_FOUND and "batch" in first_error.message:
+            # The mod predates batch support - fall back to one request per call from now on
+            self.logger.info("Mod does not support batch requests, sending calls individually")
+            self._batch_supported = False
+            await self._send(batch)
+            return
+
+        for (_, _, future), response in zip(batch, responses):
+            _resolve(future, response)
+
+
+def _resolve(future: asyncio.Future, response: Optional[Response] = None, exception: Optional[BaseException] = None) -> None:
+    """Complete a caller's future unless the caller has already gone away."""
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(response)
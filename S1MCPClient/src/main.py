@@ -1,195 +1,380 @@
 """Main entry point for S1MCPClient MCP server."""
 
 import asyncio
+import atexit
+import importlib
+import logging
+import os
+import platform
 import sys
+import tempfile
+from dataclasses import dataclass
+from typing import Awaitable, Callable
 from mcp.server import Server
 from mcp.server.models import InitializationOptions
 from mcp.server.stdio import stdio_server
-from mcp.types import Tool, ServerCapabilities, ToolsCapability, Prompt
+from mcp.types import Tool, TextContent, ServerCapabilities, ToolsCapability, Prompt, CallToolResult
 
-from .tcp_client import TcpClient, TcpConnectionError
+try:
+    import fastjsonschema
+except ImportError:  # Optional: argument validation falls back to the MCP SDK's jsonschema check
+    fastjsonschema = None
+
+from .tcp_client import TcpClient, TcpConnectionError, tcp_client_ctx
+from .server_state import server_state
 from .utils.config import Config
 from .utils.logger import setup_logger, get_logger
+from .utils.tool_cache import ToolCallCacher
+from .utils.profiler import McpProfiler
+
+
+# kernel32 process probes, resolved once with explicit signatures so handles and PIDs
+# are marshalled at their real widths instead of as default C ints
+if platform.system() == "Windows":
+    import ctypes
+    from ctypes import wintypes
+    
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    _OpenProcess = _kernel32.OpenProcess
+    _OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    _OpenProcess.restype = wintypes.HANDLE
+    _CloseHandle = _kernel32.CloseHandle
+    _CloseHandle.argtypes = [wintypes.HANDLE]
+    _CloseHandle.restype = wintypes.BOOL
+else:
+    _OpenProcess = None
+    _CloseHandle = None
+_PROCESS_QUERY_INFORMATION = 0x1000
+
 
-# Import all tool modules
-from .tools import npc_tools
-from .tools import player_tools
-from .tools import item_tools
-from .tools import property_tools
-from .tools import vehicle_tools
-from .tools import game_state_tools
-from .tools import debug_tools
-from .tools import log_tools
-from .tools import game_lifecycle_tools
-from .tools import load_manager_tools
-from .tools import s1api_docs_tools
-
-
-# Global TCP client instance
-tcp_client: TcpClient | None = None
-# Store instructions from handshake
-server_instructions: str | None = None
-# Track connection state
-is_connected: bool = False
 logger = get_logger()
 
 
+# Error messages returned to the client when a tool handler fails
+_CONN_ERR_TMPL = "Error: Connection failed - {}. Please ensure the game is running with the mod loaded."
+_GENERIC_ERR_TMPL = "Error executing tool '{}': {}"
+_NOT_CONNECTED_MSG = (
+    "Error: Game is not connected. Please launch the game first using s1_launch_game.\n"
+    "Once the game is running and connected, you can use other game tools."
+)
+# Returned as-is for every call rejected while the game is not connected
+_NOT_CONNECTED_RESULT = [TextContent(type="text", text=_NOT_CONNECTED_MSG)]
+
 # Lifecycle tools that don't require game connection
-LIFECYCLE_TOOLS = {"s1_launch_game", "s1_close_game", "s1_get_game_process_info", "s1_search_s1api_docs"}
+LIFECYCLE_TOOLS: frozenset[str] = frozenset({"s1_launch_game", "s1_close_game", "s1_get_game_process_info", "s1_search_s1api_docs"})
+
+# Tools whose handlers also take the config
+CONFIG_TOOLS: frozenset[str] = frozenset({"s1_launch_game", "s1_close_game", "s1_get_game_process_info"})
+
+# Tool modules (under .tools) loaded by create_server, with their log labels.
+# Each is imported on first use and provides get_<module name>() and TOOL_HANDLERS.
+TOOL_MODULES = (
+    ("npc_tools", "NPC"),
+    ("player_tools", "player"),
+    ("item_tools", "item"),
+    ("property_tools", "property"),
+    ("vehicle_tools", "vehicle"),
+    ("game_state_tools", "game state"),
+    ("debug_tools", "debug"),
+    ("log_tools", "log"),
+    ("game_lifecycle_tools", "game lifecycle"),
+    ("load_manager_tools", "LoadManager"),
+    ("s1api_docs_tools", "S1API documentation"),
+)
+
+
+@dataclass(slots=True)
+class ToolEntry:
+    """A registered tool definition together with its call handler (which takes only the arguments)."""
+    
+    tool: Tool
+    handler: Callable[[dict], Awaitable[list]]
 
 
-def can_call_tool(tool_name: str) -> tuple[bool, str]:
+def _process_exists(pid: int) -> bool:
     """
-    Check if a tool can be called based on connection state.
+    Check whether a process with the given PID is still running.
     
     Args:
-        tool_name: Name of the tool to check
+        pid: Process ID to check
     
     Returns:
-        Tuple of (can_call, error_message)
+        True if the process exists
     """
-    global is_connected
-    
-    # Lifecycle tools can always be called
-    if tool_name in LIFECYCLE_TOOLS:
-        return True, ""
-    
-    # All other tools require game connection
-    if not is_connected:
-        return False, (
-            "Error: Game is not connected. Please launch the game first using s1_launch_game.\n"
-            "Once the game is running and connected, you can use other game tools."
-        )
-    
-    return True, ""
+    # On Windows, os.kill() doesn't support signal 0, so we use a different approach
+    try:
+        if _OpenProcess is not None:
+            # On Windows, try to open the process to check if it exists
+            handle = _OpenProcess(_PROCESS_QUERY_INFORMATION, False, pid)
+            if handle:
+                _CloseHandle(handle)
+                return True
+            # If handle is NULL, the process doesn't exist or we don't have permission
+            return False
+        # On Unix, use signal 0
+        os.kill(pid, 0)
+        return True
+    except (OSError, ProcessLookupError, ValueError, AttributeError):
+        # Process doesn't exist or error accessing it
+        return False
 
 
-def create_server(config: Config, tcp_client: TcpClient) -> Server:
+def _claim_pid_file(pid_file: str) -> None:
     """
-    Create and configure the MCP server.
+    Write our PID to the PID file without a check-then-write race.
+    
+    The file is created exclusively; if it already exists, the previous owner
+    is reported when still alive and the file is atomically replaced.
     
     Args:
-        config: Configuration instance
-        tcp_client: TCP client instance
+        pid_file: Path to the PID file
     
-    Returns:
-        Configured MCP server
+    Raises:
+        OSError: If the PID file can't be written
     """
-    server = Server("s1mcpclient")
+    pid_bytes = str(os.getpid()).encode("ascii")
     
-    # Collect all tools
-    all_tools: list[Tool] = []
-    all_tool_handlers: dict[str, callable] = {}
-    
-    # NPC tools
     try:
-        tools = npc_tools.get_npc_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(npc_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} NPC tools")
-    except Exception as e:
-        logger.error(f"Error loading NPC tools: {e}", exc_info=True)
+        fd = os.open(pid_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o644)
+    except FileExistsError:
+        try:
+            fd = os.open(pid_file, os.O_RDONLY)
+            try:
+                old_pid = int(os.read(fd, 32).strip())
+            finally:
+                os.close(fd)
+        except (ValueError, OSError):
+            old_pid = None  # Invalid or unreadable PID file, just replace it
+        
+        if old_pid is not None and _process_exists(old_pid):
+            logger.warning("Another instance appears to be running (PID: %s). Continuing anyway...", old_pid)
+        
+        # Write to a temp file in the same directory and swap it in atomically
+        tmp_fd, tmp_path = tempfile.mkstemp(prefix="s1mcpclient.", suffix=".pid.tmp", dir=os.path.dirname(pid_file))
+        try:
+            try:
+                os.write(tmp_fd, pid_bytes)
+            finally:
+                os.close(tmp_fd)
+            os.replace(tmp_path, pid_file)
+        except OSError:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+            raise
+        return
     
-    # Player tools
     try:
-        tools = player_tools.get_player_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(player_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} player tools")
-    except Exception as e:
-        logger.error(f"Error loading player tools: {e}", exc_info=True)
+        os.write(fd, pid_bytes)
+    finally:
+        os.close(fd)
+
+
+async def bootstrap_connection(tcp_client: TcpClient) -> None:
+    """
+    Connect to the mod and perform the handshake without blocking the event loop.
     
-    # Item tools
-    try:
-        tools = item_tools.get_item_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(item_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} item tools")
-    except Exception as e:
-        logger.error(f"Error loading item tools: {e}", exc_info=True)
+    Sets the connection state and server instructions, then signals
+    connection_ready whether or not the mod could be reached. The connect and
+    handshake are bounded by the client's socket timeouts, so the state set
+    here always matches what the worker thread actually did.
     
-    # Property tools
+    Args:
+        tcp_client: TCP client instance
+    """
     try:
-        tools = property_tools.get_property_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(property_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} property tools")
-    except Exception as e:
-        logger.error(f"Error loading property tools: {e}", exc_info=True)
+        # Try to connect (optional - game might not be running yet)
+        try:
+            logger.debug("Attempting initial connection to mod (optional)...")
+            await asyncio.to_thread(tcp_client.connect)
+            logger.info("Connected to mod successfully")
+        except TcpConnectionError as e:
+            logger.info("Game not running at startup: %s", e)
+            logger.info("MCP server will wait for game to be launched via s1_launch_game tool.")
+            server_state.connected = False
+            return
+        except Exception as e:
+            logger.error("Unexpected error connecting to mod: %s", e, exc_info=True)
+            server_state.connected = False
+            return
+        
+        # Perform handshake to verify connection and get available methods
+        try:
+            logger.debug("Performing handshake with mod...")
+            handshake_response = await asyncio.to_thread(tcp_client.call, "handshake", {})
+            
+            if handshake_response.error:
+                logger.warning("Handshake failed: %s", handshake_response.error.message)
+            else:
+                handshake_data = handshake_response.result
+                if isinstance(handshake_data, dict):
+                    available_methods = handshake_data.get("available_methods", [])
+                    total_methods = handshake_data.get("total_methods", 0)
+                    server_name = handshake_data.get("server_name", "Unknown")
+                    version = handshake_data.get("version", "Unknown")
+                    
+                    # Extract instructions for LLM prompt
+                    instructions = handshake_data.get("instructions")
+                    server_state.instructions = instructions
+                    if instructions:
+                        logger.info("Received server instructions for LLM prompt (%d characters)", len(instructions))
+                        logger.debug("Instructions preview: %s...", instructions[:200])
+                    else:
+                        logger.warning("No instructions provided in handshake response")
+                    
+                    logger.info("Handshake successful: %s v%s", server_name, version)
+                    logger.info("Available methods: %s", total_methods)
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("Methods: %s", ", ".join(available_methods))
+                    
+                    # Mark as connected
+                    server_state.connected = True
+                    
+                    # Log method categories if available
+                    if "method_categories" in handshake_data:
+                        categories = handshake_data["method_categories"]
+                        for category, methods in categories.items():
+                            if methods:
+                                logger.debug("  %s: %d methods", category, len(methods))
+                    
+                    # Log integrations
+                    if "integrations" in handshake_data:
+                        integrations = handshake_data["integrations"]
+                        logger.debug("Integrations: %s", integrations)
+                else:
+                    logger.warning("Handshake response format unexpected")
+        except Exception as e:
+            logger.warning("Handshake failed: %s. Connection may still work.", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Handshake error details", exc_info=e)
+    finally:
+        server_state.connection_ready.set()
+
+
+def _is_error_result(result: list) -> bool:
+    """Check whether a tool result is one of the handlers' "Error: ..." replies."""
+    return bool(result) and getattr(result[0], "text", "").startswith("Error")
+
+
+def _make_dispatcher(name: str, handler: Callable[..., Awaitable[list]], config: Config) -> Callable[[dict], Awaitable[list]]:
+    """
+    Build the function that runs one tool given only its arguments.
     
-    # Vehicle tools
-    try:
-        tools = vehicle_tools.get_vehicle_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(vehicle_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} vehicle tools")
-    except Exception as e:
-        logger.error(f"Error loading vehicle tools: {e}", exc_info=True)
+    Whether the tool needs config and whether it needs a game connection is
+    decided here, once, so a call doesn't have to work it out again.
     
-    # Game state tools
-    try:
-        tools = game_state_tools.get_game_state_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(game_state_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} game state tools")
-    except Exception as e:
-        logger.error(f"Error loading game state tools: {e}", exc_info=True)
+    Args:
+        name: Tool name
+        handler: Tool handler from its module's TOOL_HANDLERS
+        config: Configuration instance, bound for handlers that need it
     
-    # Debug tools
-    try:
-        tools = debug_tools.get_debug_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(debug_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} debug tools")
-    except Exception as e:
-        logger.error(f"Error loading debug tools: {e}", exc_info=True)
+    Returns:
+        The handler itself, or a wrapper that passes config along or
+        rejects the call while the game is not connected
+    """
+    if name in CONFIG_TOOLS:
+        async def dispatch(arguments: dict) -> list:
+            return await handler(arguments, config)
+    elif name not in LIFECYCLE_TOOLS:
+        # Game tools need the mod connection
+        async def dispatch(arguments: dict) -> list:
+            if not server_state.connected:
+                logger.warning("Tool %s called but game not connected", name)
+                return _NOT_CONNECTED_RESULT
+            return await handler(arguments)
+    else:
+        return handler
+    
+    dispatch.__name__ = dispatch.__qualname__ = f"_dispatch_{name}"
+    return dispatch
+
+
+def _compile_schema_validators(tools: tuple[Tool, ...]) -> dict[str, Callable[[dict], object]]:
+    """
+    Generate argument validators for each tool's input schema with fastjsonschema.
     
-    # Log tools
-    try:
-        tools = log_tools.get_log_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(log_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} log tools")
-    except Exception as e:
-        logger.error(f"Error loading log tools: {e}", exc_info=True)
+    Args:
+        tools: Tool definitions
     
-    # Game lifecycle tools
-    try:
-        tools = game_lifecycle_tools.get_game_lifecycle_tools(tcp_client, config)
-        all_tools.extend(tools)
-        all_tool_handlers.update(game_lifecycle_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} game lifecycle tools")
-    except Exception as e:
-        logger.error(f"Error loading game lifecycle tools: {e}", exc_info=True)
+    Returns:
+        Validator per tool name, or an empty dict if fastjsonschema is unavailable
+        or any schema fails to compile
+    """
+    if fastjsonschema is None:
+        return {}
     
-    # LoadManager tools
-    try:
-        tools = load_manager_tools.get_load_manager_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(load_manager_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} LoadManager tools")
-    except Exception as e:
-        logger.error(f"Error loading LoadManager tools: {e}", exc_info=True)
+    validators = {}
+    for tool in tools:
+        try:
+            validators[tool.name] = fastjsonschema.compile(tool.inputSchema, use_default=False)
+        except Exception as e:
+            logger.warning("Could not compile input schema for %s, using SDK validation instead: %s", tool.name, e)
+            return {}
+    return validators
+
+
+def create_server(config: Config, tcp_client: TcpClient) -> Server:
+    """
+    Create and configure the MCP server.
     
-    # S1API documentation tools
-    try:
-        tools = s1api_docs_tools.get_s1api_docs_tools(tcp_client)
-        all_tools.extend(tools)
-        all_tool_handlers.update(s1api_docs_tools.TOOL_HANDLERS)
-        logger.debug(f"Loaded {len(tools)} S1API documentation tools")
-    except Exception as e:
-        logger.error(f"Error loading S1API documentation tools: {e}", exc_info=True)
+    Args:
+        config: Configuration instance
+        tcp_client: TCP client instance
+    
+    Returns:
+        Configured MCP server
+    """
+    server = Server("s1mcpclient")
+    
+    # Tool handlers pick the client up from context; tasks spawned by the server inherit it
+    tcp_client_ctx.set(tcp_client)
+    
+    # Collect all tools, keyed by name with their handler alongside
+    registry: dict[str, ToolEntry] = {}
+    read_only_tools: set[str] = set()
+    static_tools: set[str] = set()
+    
+    for module_name, label in TOOL_MODULES:
+        try:
+            module = importlib.import_module(f".tools.{module_name}", __package__)
+            tools = getattr(module, f"get_{module_name}")()
+            handlers = module.TOOL_HANDLERS
+            for tool in tools:
+                handler = handlers.get(tool.name)
+                if handler is None:
+                    logger.warning("Tool %s has no handler, skipping", tool.name)
+                    continue
+                # Interned so per-call lookups with the interned request name compare by identity
+                name = sys.intern(tool.name)
+                registry[name] = ToolEntry(tool, _make_dispatcher(name, handler, config))
+            read_only_tools.update(map(sys.intern, getattr(module, "READ_ONLY_TOOLS", ())))
+            static_tools.update(map(sys.intern, getattr(module, "STATIC_TOOLS", ())))
+            logger.debug("Loaded %d %s tools", len(tools), label)
+        except Exception as e:
+            logger.error("Error loading %s tools: %s", label, e, exc_info=True)
     
     # Log tool collection
-    logger.info(f"Collected {len(all_tools)} tools: {[tool.name for tool in all_tools]}")
-    logger.info(f"Collected {len(all_tool_handlers)} tool handlers: {list(all_tool_handlers.keys())}")
+    available_tool_names = ", ".join(registry)
+    logger.info("Collected %d tools: %s", len(registry), available_tool_names)
+    
+    # Unknown-tool error with the tool list already filled in; only the requested name varies
+    unknown_tool_template = (
+        "Error: Unknown tool '{}'. Available tools: "
+        + available_tool_names.replace("{", "{{").replace("}", "}}")
+    )
+    
+    # Tool definitions don't change after startup, so every list_tools call
+    # hands out the same immutable snapshot
+    tools_snapshot: tuple[Tool, ...] = tuple(entry.tool for entry in registry.values())
+    read_only_tools = frozenset(read_only_tools)
     
     # Register list_tools handler
     @server.list_tools()
-    async def handle_list_tools() -> list[Tool]:
+    async def handle_list_tools() -> tuple[Tool, ...]:
         """List all available tools."""
-        logger.debug(f"list_tools called, returning {len(all_tools)} tools")
-        return all_tools
+        logger.debug("list_tools called, returning %d tools", len(tools_snapshot))
+        return tools_snapshot
     
     # Register list_prompts handler (if we want to expose prompts)
     # For now, instructions are passed via InitializationOptions which provides context to the LLM
@@ -200,9 +385,21 @@ def create_server(config: Config, tcp_client: TcpClient) -> Server:
         # Currently no prompts - instructions are passed via InitializationOptions
         return []
     
-    # Register call_tool handler
-    @server.call_tool()
-    async def handle_call_tool(name: str, arguments: dict) -> list:
+    # Argument validators generated once from each tool's input schema
+    schema_validators = _compile_schema_validators(tools_snapshot)
+    
+    # Repeated read-only queries are answered from memory for a short time
+    call_cache = ToolCallCacher(ttl=config.tool_cache_ttl)
+    
+    # Optional latency percentiles for the dispatch path
+    profiler = McpProfiler(config.profile_report_interval) if config.profile_report_interval > 0 else None
+    
+    # The log level is set once in main() before the server is created, so check it once here
+    debug_enabled = logger.isEnabledFor(logging.DEBUG)
+    
+    # Register call_tool handler (the SDK only validates arguments if we couldn't compile validators)
+    @server.call_tool(validate_input=not schema_validators)
+    async def handle_call_tool(name: str, arguments: dict) -> list[TextContent] | CallToolResult:
         """
         Handle tool calls.
         
@@ -213,47 +410,78 @@ def create_server(config: Config, tcp_client: TcpClient) -> Server:
         Returns:
             Tool result
         """
-        from mcp.types import TextContent
+        started_ns = profiler.now() if profiler is not None else 0
+        # Names decoded from JSON are fresh strings; interning once makes the registry,
+        # cache and read-only lookups below hit the identity fast path
+        name = sys.intern(name)
+        if debug_enabled:
+            logger.debug("Tool call received: %s with arguments: %r", name, arguments)
         
-        logger.debug(f"Tool call received: {name} with arguments: {arguments}")
+        # Don't judge connection state while the startup handshake is still in flight
+        connection_ready = server_state.connection_ready
+        if connection_ready is not None and not connection_ready.is_set():
+            await connection_ready.wait()
         
-        if name not in all_tool_handlers:
-            logger.error(f"Unknown tool: {name}")
-            logger.debug(f"Available tools: {list(all_tool_handlers.keys())}")
-            return [TextContent(
-                type="text",
-                text=f"Error: Unknown tool '{name}'. Available tools: {', '.join(all_tool_handlers.keys())}"
-            )]
+        entry = registry.get(name)
+        if entry is None:
+            logger.error("Unknown tool: %s", name)
+            return [TextContent(type="text", text=unknown_tool_template.format(name))]
         
-        # Check if tool can be called based on connection state
-        can_call, error_msg = can_call_tool(name)
-        if not can_call:
-            logger.warning(f"Tool {name} called but game not connected")
-            return [TextContent(type="text", text=error_msg)]
+        validate = schema_validators.get(name)
+        if validate is not None:
+            try:
+                validate(arguments)
+            except fastjsonschema.JsonSchemaException as e:
+                return CallToolResult(
+                    content=[TextContent(type="text", text=f"Input validation error: {e.message}")],
+                    isError=True
+                )
         
-        handler = all_tool_handlers[name]
-        logger.debug(f"Found handler for {name}, invoking...")
+        cacheable = call_cache.enabled and name in read_only_tools
+        if cacheable:
+            generation = call_cache.generation
+            cached = call_cache.get(name, arguments)
+            if cached is not None:
+                if debug_enabled:
+                    logger.debug("Tool %s served from cache", name)
+                if profiler is not None:
+                    profiler.record(name, "cached", started_ns, profiler.now())
+                    profiler.call_finished()
+                return cached
+        else:
+            # Anything that isn't a pure read may have changed game state
+            call_cache.invalidate()
         
         try:
-            # Game lifecycle tools need config parameter
-            if name.startswith("s1_launch_game") or name.startswith("s1_close_game") or name.startswith("s1_get_game_process_info"):
-                result = await handler(arguments, tcp_client, config)
-            else:
-                result = await handler(arguments, tcp_client)
-            logger.debug(f"Tool {name} completed successfully, result type: {type(result)}")
+            handler_started_ns = profiler.now() if profiler is not None else 0
+            result = await entry.handler(arguments)
+            handler_ended_ns = profiler.now() if profiler is not None else 0
+            if debug_enabled:
+                logger.debug("Tool %s completed successfully, result type: %s", name, type(result))
+            if cacheable and not _is_error_result(result):
+                call_cache.put(name, arguments, result, static=name in static_tools, generation=generation)
+            elif not cacheable:
+                # Reads that started while this call ran may have cached state from before it finished
+                call_cache.invalidate()
+            if profiler is not None:
+                profiler.record(name, "dispatch", started_ns, handler_started_ns)
+                profiler.record(name, "handler", handler_started_ns, handler_ended_ns)
+                profiler.record(name, "total", started_ns, profiler.now())
+                profiler.call_finished()
             return result
         except TcpConnectionError as e:
-            logger.error(f"Connection error in tool handler {name}: {e}", exc_info=True)
+            # Expected when the game isn't running - the message says enough without a traceback
+            logger.error("Connection error in tool handler %s: %s", name, e)
             return [TextContent(
                 type="text",
-                text=f"Error: Connection failed - {str(e)}. Please ensure the game is running with the mod loaded."
+                text=_CONN_ERR_TMPL.format(e)
             )]
         except Exception as e:
-            logger.error(f"Error in tool handler {name}: {e}", exc_info=True)
+            logger.error("Error in tool handler %s: %s", name, e, exc_info=True)
             # Return error as TextContent instead of raising to prevent TaskGroup errors
             return [TextContent(
                 type="text",
-                text=f"Error executing tool '{name}': {str(e)}"
+                text=_GENERIC_ERR_TMPL.format(name, e)
             )]
     
     return server
@@ -261,70 +489,20 @@ def create_server(config: Config, tcp_client: TcpClient) -> Server:
 
 async def main():
     """Main entry point."""
-    global tcp_client
-    
     # Prevent multiple instances - check if we're already running
-    import atexit
-    import os
-    import tempfile
-    import platform
-    
     pid_file = os.path.join(tempfile.gettempdir(), "s1mcpclient.pid")
-    if os.path.exists(pid_file):
-        try:
-            with open(pid_file, 'r') as f:
-                old_pid = int(f.read().strip())
-            # Check if the process is still running
-            # On Windows, os.kill() doesn't support signal 0, so we use a different approach
-            process_exists = False
-            try:
-                if platform.system() == "Windows":
-                    # On Windows, try to open the process to check if it exists
-                    import ctypes
-                    kernel32 = ctypes.windll.kernel32
-                    handle = kernel32.OpenProcess(0x1000, False, old_pid)  # PROCESS_QUERY_INFORMATION
-                    if handle and handle != 0:
-                        kernel32.CloseHandle(handle)
-                        process_exists = True
-                    # If handle is 0, the process doesn't exist or we don't have permission
-                else:
-                    # On Unix, use signal 0
-                    os.kill(old_pid, 0)
-                    process_exists = True
-            except (OSError, ProcessLookupError, ValueError, AttributeError):
-                # Process doesn't exist or error accessing it
-                process_exists = False
-            
-            if process_exists:
-                logger.warning(f"Another instance appears to be running (PID: {old_pid}). Continuing anyway...")
-            else:
-                # Process doesn't exist, remove stale PID file
-                try:
-                    os.remove(pid_file)
-                except OSError:
-                    pass  # Ignore errors removing stale PID file
-        except (ValueError, IOError, OSError):
-            # Invalid PID file, remove it
-            try:
-                os.remove(pid_file)
-            except OSError:
-                pass  # Ignore errors removing invalid PID file
-    
-    # Write our PID
     try:
-        with open(pid_file, 'w') as f:
-            f.write(str(os.getpid()))
+        _claim_pid_file(pid_file)
         
         def cleanup_pid():
             try:
-                if os.path.exists(pid_file):
-                    os.remove(pid_file)
+                os.remove(pid_file)
             except OSError:
-                pass  # Ignore errors during cleanup
+                pass  # Already gone, or can't be removed
         
         atexit.register(cleanup_pid)
     except Exception as e:
-        logger.debug(f"Could not create PID file: {e}")
+        logger.debug("Could not create PID file: %s", e)
     
     # Load configuration
     config = Config.from_file()
@@ -339,90 +517,40 @@ async def main():
             host=config.host,
             port=config.port,
             timeout=config.connection_timeout,
-            reconnect_delay=config.reconnect_delay
+            reconnect_delay=config.reconnect_delay,
+            batch_window=config.batch_window_ms / 1000
         )
-        
-        # Try to connect (optional - game might not be running yet)
-        global is_connected
-        try:
-            logger.debug("Attempting initial connection to mod (optional)...")
-            tcp_client.connect()
-            logger.info("Connected to mod successfully")
-            
-            # Perform handshake to verify connection and get available methods
-            try:
-                logger.debug("Performing handshake with mod...")
-                handshake_response = tcp_client.call("handshake", {})
-                
-                if handshake_response.error:
-                    logger.warning(f"Handshake failed: {handshake_response.error.message}")
-                else:
-                    handshake_data = handshake_response.result
-                    if isinstance(handshake_data, dict):
-                        available_methods = handshake_data.get("available_methods", [])
-                        total_methods = handshake_data.get("total_methods", 0)
-                        server_name = handshake_data.get("server_name", "Unknown")
-                        version = handshake_data.get("version", "Unknown")
-                        
-                        # Extract instructions for LLM prompt
-                        global server_instructions
-                        server_instructions = handshake_data.get("instructions")
-                        if server_instructions:
-                            logger.info(f"Received server instructions for LLM prompt ({len(server_instructions)} characters)")
-                            logger.debug(f"Instructions preview: {server_instructions[:200]}...")
-                        else:
-                            logger.warning("No instructions provided in handshake response")
-                        
-                        logger.info(f"Handshake successful: {server_name} v{version}")
-                        logger.info(f"Available methods: {total_methods}")
-                        logger.debug(f"Methods: {', '.join(available_methods)}")
-                        
-                        # Mark as connected
-                        is_connected = True
-                        
-                        # Log method categories if available
-                        if "method_categories" in handshake_data:
-                            categories = handshake_data["method_categories"]
-                            for category, methods in categories.items():
-                                if methods:
-                                    logger.debug(f"  {category}: {len(methods)} methods")
-                        
-                        # Log integrations
-                        if "integrations" in handshake_data:
-                            integrations = handshake_data["integrations"]
-                            logger.debug(f"Integrations: {integrations}")
-                    else:
-                        logger.warning("Handshake response format unexpected")
-            except Exception as e:
-                logger.warning(f"Handshake failed: {e}. Connection may still work.")
-                logger.debug(f"Handshake error details: {e}", exc_info=True)
-                
-        except TcpConnectionError as e:
-            logger.info(f"Game not running at startup: {e}")
-            logger.info("MCP server will wait for game to be launched via s1_launch_game tool.")
-            is_connected = False
-        
     except Exception as e:
-        logger.error(f"Failed to initialize TCP client: {e}")
+        logger.error("Failed to initialize TCP client: %s", e)
         sys.exit(1)
     
+    # Connect and handshake in the background so the stdio transport and tool
+    # registration don't wait on the mod (the game might not be running yet)
+    server_state.connection_ready = asyncio.Event()
+    bootstrap_task = asyncio.create_task(bootstrap_connection(tcp_client))
+    
     # Create server
     try:
         server = create_server(config, tcp_client)
         logger.info("MCP server created, registering tools...")
     except Exception as e:
-        logger.error(f"Failed to create server: {e}")
+        logger.error("Failed to create server: %s", e)
         sys.exit(1)
     
     # Run server with stdio transport
     try:
         logger.info("Starting MCP server with stdio transport...")
         async with stdio_server() as (read_stream, write_stream):
+            # Instructions come from the handshake, so give it a bounded chance to finish
+            # before building InitializationOptions; it keeps running in the background
+            # if the mod is slow to answer
+            await asyncio.wait({bootstrap_task}, timeout=config.connection_timeout)
             # Create initialization options with tools capability enabled
             # Use instructions from handshake if available
-            logger.info(f"Creating InitializationOptions with instructions: {server_instructions is not None}")
+            server_instructions = server_state.instructions
+            logger.info("Creating InitializationOptions with instructions: %s", server_instructions is not None)
             if server_instructions:
-                logger.info(f"Instructions length: {len(server_instructions)} characters")
+                logger.info("Instructions length: %d characters", len(server_instructions))
             init_options = InitializationOptions(
                 server_name="s1mcpclient",
                 server_version="0.1.0",
@@ -432,7 +560,7 @@ async def main():
                 instructions=server_instructions
             )
             if server_instructions:
-                logger.info(f"InitializationOptions created with server-provided instructions ({len(server_instructions)} chars)")
+                logger.info("InitializationOptions created with server-provided instructions (%d chars)", len(server_instructions))
             else:
                 logger.warning("InitializationOptions created WITHOUT instructions - handshake may not have completed")
             await server.run(
@@ -443,43 +571,51 @@ async def main():
     except KeyboardInterrupt:
         logger.info("Received interrupt signal, shutting down...")
     except Exception as e:
-        logger.error(f"Server error: {e}", exc_info=True)
+        logger.error("Server error: %s", e, exc_info=True)
         # Don't exit immediately - let finally block clean up
         raise
     finally:
         # Cleanup
-        if tcp_client:
-            try:
-                tcp_client.disconnect()
-            except Exception as e:
-                logger.warning(f"Error disconnecting TCP client: {e}")
+        if not bootstrap_task.done():
+            bootstrap_task.cancel()
+        try:
+            tcp_client.disconnect()
+        except Exception as e:
+            logger.warning("Error disconnecting TCP client: %s", e)
         logger.info("MCP server stopped")
 
 
+def _log_fatal_exception(exc_type, exc, tb) -> None:
+    """Log an exception that escaped main() (installed as sys.excepthook)."""
+    if issubclass(exc_type, KeyboardInterrupt):
+        return
+    label = "Fatal OS error" if issubclass(exc_type, OSError) else "Fatal error"
+    try:
+        logger.error("%s: %s: %s", label, exc_type.__name__, exc, exc_info=(exc_type, exc, tb))
+    except Exception:
+        # Logger might not be usable - fall back to the default hook
+        sys.__excepthook__(exc_type, exc, tb)
+
+
+def _install_fast_event_loop() -> None:
+    """Use uvloop (winloop on Windows) as the event loop if it is installed."""
+    loop_module_name = "winloop" if platform.system() == "Windows" else "uvloop"
+    try:
+        loop_module = importlib.import_module(loop_module_name)
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(loop_module.EventLoopPolicy())
+
+
 def entry_point():
     """Entry point for the application."""
+    sys.excepthook = _log_fatal_exception
+    _install_fast_event_loop()
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
-        try:
-            logger.info("Interrupted by user")
-        except:
-            pass  # Logger might not be initialized
+        logger.info("Interrupted by user")
         sys.exit(0)
-    except OSError as e:
-        try:
-            logger.error(f"Fatal OS error: {type(e).__name__}: {e}", exc_info=True)
-        except:
-            print(f"Fatal OS error: {type(e).__name__}: {e}", file=sys.stderr)
-        sys.exit(1)
-    except Exception as e:
-        try:
-            logger.error(f"Fatal error: {type(e).__name__}: {e}", exc_info=True)
-        except:
-            print(f"Fatal error: {type(e).__name__}: {e}", file=sys.stderr)
-            import traceback
-            traceback.print_exc()
-        sys.exit(1)
 
 
 if __name__ == "__main__":
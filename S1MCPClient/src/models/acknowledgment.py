@@ -1,21 +1,18 @@
 """Acknowledgment model for JSON-RPC communication."""
 
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
 
 
-class Acknowledgment(BaseModel):
-    """Acknowledgment model for confirming receipt of responses."""
-    
-    id: int = Field(..., description="Request ID that this acknowledgment corresponds to")
-    status: str = Field(default="received", description="Acknowledgment status")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "status": "received"
-            }
-        }
+@dataclass(slots=True)
+class Acknowledgment:
+    """
+    Acknowledgment model for confirming receipt of responses.
 
+    Example:
+        Acknowledgment(id=1, status="received")
+    """
 
+    # Request ID that this acknowledgment corresponds to
+    id: int
+    # Acknowledgment status
+    status: str = "received"
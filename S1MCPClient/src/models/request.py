@@ -1,25 +1,21 @@
 """Request model for JSON-RPC communication."""
 
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
-from pydantic import BaseModel, Field
 
 
-class Request(BaseModel):
-    """JSON-RPC request model matching the mod's Request structure."""
-    
-    id: int = Field(..., description="Unique request identifier")
-    method: str = Field(..., description="Method name to invoke")
-    params: Optional[Dict[str, Any]] = Field(None, description="Method parameters as a JSON object")
-    
-    class Config:
-        """Pydantic configuration."""
-        json_schema_extra = {
-            "example": {
-                "id": 1,
-                "method": "get_npc",
-                "params": {
-                    "npc_id": "kyle_cooley"
-                }
-            }
-        }
+@dataclass(slots=True)
+class Request:
+    """
+    JSON-RPC request model matching the mod's Request structure.
 
+    Example:
+        Request(id=1, method="get_npc", params={"npc_id": "kyle_cooley"})
+    """
+
+    # Unique request identifier
+    id: int
+    # Method name to invoke
+    method: str
+    # Method parameters as a JSON object
+    params: Optional[Dict[str, Any]] = None
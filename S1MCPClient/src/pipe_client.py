@@ -1,6 +1,7 @@
 """Windows Named Pipe client for communicating with the mod."""
 
-import struct
+import itertools
+import logging
 import threading
 import time
 from typing import Any, Dict, Optional, Callable
@@ -8,10 +9,9 @@ import win32pipe
 import win32file
 import pywintypes
 
-from .models.request import Request
 from .models.response import Response
 from .models.acknowledgment import Acknowledgment
-from .protocol import serialize_request, deserialize_response, ProtocolError, create_request
+from .protocol import encode_request, decode_response, encode_json, ProtocolError, LENGTH_PREFIX, MAX_MESSAGE_SIZE
 from .utils.logger import get_logger
 
 
@@ -23,7 +23,7 @@ class PipeConnectionError(Exception):
 class NamedPipeClient:
     """Windows Named Pipe client for mod communication."""
     
-    def __init__(self, pipe_name: str = "S1MCPServer", timeout: float = 5.0, reconnect_delay: float = 1.0):
+    def __init__(self, pipe_name: str = "S1MCPServer", timeout: float = 5.0, reconnect_delay: float = 1.0, max_message_size: int = MAX_MESSAGE_SIZE):
         """
         Initialize the named pipe client.
         
@@ -31,18 +31,22 @@ class NamedPipeClient:
             pipe_name: Name of the named pipe (without \\.\pipe\ prefix)
             timeout: Connection timeout in seconds
             reconnect_delay: Delay before reconnection attempts in seconds
+            max_message_size: Largest response payload to accept, in bytes
         """
         self.pipe_name = pipe_name
         self.pipe_path = f"\\\\.\\pipe\\{pipe_name}"
         self.timeout = timeout
         self.reconnect_delay = reconnect_delay
+        self.max_message_size = max_message_size
         self.logger = get_logger()
         
         self._handle: Optional[int] = None
         self._connected = False
         self._lock = threading.Lock()
-        self._request_id_counter = 0
-        self._request_id_lock = threading.Lock()
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        self._request_ids = itertools.count(1)
+        # Acknowledgment of the last response, sent together with the next request
+        self._pending_ack = b""
     
     def connect(self) -> None:
         """
@@ -73,6 +77,7 @@ class NamedPipeClient:
                 )
                 
                 self._connected = True
+                self._pending_ack = b""
                 self.logger.info(f"Connected to named pipe successfully (handle: {self._handle})")
                 self.logger.debug(f"Pipe path: {self.pipe_path}")
                 self.logger.debug(f"Connection state: _connected={self._connected}, handle_valid={self._handle is not None}")
@@ -89,14 +94,26 @@ class NamedPipeClient:
         """Disconnect from the named pipe server."""
         with self._lock:
             if self._handle is not None:
-                try:
-                    win32file.CloseHandle(self._handle)
-                except Exception as e:
-                    self.logger.warning(f"Error closing pipe handle: {e}")
-                finally:
-                    self._handle = None
-                    self._connected = False
-                    self.logger.info("Disconnected from named pipe")
+                if self._pending_ack and self._connected:
+                    try:
+                        self._write_message(self._pending_ack)
+                    except Exception as e:
+                        self.logger.debug(f"Could not send final acknowledgment: {e}")
+                self._close_handle()
+                self.logger.info("Disconnected from named pipe")
+    
+    def _close_handle(self) -> None:
+        """Close the pipe handle and reset the connection state; the caller must hold the lock."""
+        self._pending_ack = b""
+        self._connected = False
+        if self._handle is None:
+            return
+        try:
+            win32file.CloseHandle(self._handle)
+        except Exception as e:
+            self.logger.warning(f"Error closing pipe handle: {e}")
+        finally:
+            self._handle = None
     
     def is_connected(self) -> bool:
         """Check if connected to the pipe."""
@@ -113,53 +130,46 @@ class NamedPipeClient:
     
     def _get_next_request_id(self) -> int:
         """Get the next request ID (thread-safe)."""
-        with self._request_id_lock:
-            self._request_id_counter += 1
-            return self._request_id_counter
+        return next(self._request_ids)
     
     def _read_message(self) -> bytes:
         """
         Read a complete message from the pipe.
         
         Returns:
-            Complete message bytes (length prefix + JSON)
+            JSON payload bytes (without the length prefix)
         
         Raises:
             PipeConnectionError: If read fails
         """
         try:
-            self.logger.debug("Reading message from pipe...")
-            
             # Read 4-byte length prefix
-            self.logger.debug("Reading 4-byte length prefix...")
             length_bytes, _ = win32file.ReadFile(self._handle, 4)
-            self.logger.debug(f"Read {len(length_bytes)} bytes for length prefix")
             
             if len(length_bytes) != 4:
                 raise PipeConnectionError(f"Failed to read message length: got {len(length_bytes)} bytes instead of 4")
             
-            message_length = struct.unpack('<I', length_bytes)[0]
-            self.logger.debug(f"Message length: {message_length} bytes")
+            message_length = LENGTH_PREFIX.unpack_from(length_bytes)[0]
             
-            if message_length < 0 or message_length > 10 * 1024 * 1024:  # Max 10MB
-                raise PipeConnectionError(f"Invalid message length: {message_length}")
+            # Reject oversized messages before reading the payload; call() then closes the
+            # handle, so the unread bytes can't desynchronize later messages
+            if message_length > self.max_message_size:
+                raise PipeConnectionError(f"Message too large: {message_length} bytes (max {self.max_message_size})")
             
             # Read JSON message
-            self.logger.debug(f"Reading {message_length} bytes of JSON message...")
             message_bytes, _ = win32file.ReadFile(self._handle, message_length)
-            self.logger.debug(f"Read {len(message_bytes)} bytes of message data")
             
             if len(message_bytes) != message_length:
                 raise PipeConnectionError(f"Incomplete message: expected {message_length} bytes, got {len(message_bytes)}")
             
-            # Return length prefix + message
-            total_bytes = length_bytes + message_bytes
-            self.logger.debug(f"Complete message read: {len(total_bytes)} total bytes")
-            return total_bytes
+            self.logger.debug("Read message from pipe: %d bytes", message_length)
+            
+            # Callers only need the payload, so skip re-joining it with the prefix
+            return message_bytes
             
         except pywintypes.error as e:
-            self.logger.error(f"Error reading from pipe: {e}")
-            self.logger.debug(f"Error code: {e.winerror}, Error message: {e.strerror}")
+            self.logger.error("Error reading from pipe: %s", e)
+            self.logger.debug("Error code: %s, Error message: %s", e.winerror, e.strerror)
             raise PipeConnectionError(f"Error reading from pipe: {e}") from e
     
     def _serialize_acknowledgment(self, ack: Acknowledgment) -> bytes:
@@ -172,29 +182,18 @@ class NamedPipeClient:
         Returns:
             Serialized message bytes
         """
-        import json
-        import struct
-        import logging
-        logger = logging.getLogger("S1MCPClient")
-        
         # Convert to dict
         json_dict = {
             "id": ack.id,
             "status": ack.status
         }
-        logger.debug(f"Serializing acknowledgment: {json_dict}")
         
         # Serialize to JSON
-        json_str = json.dumps(json_dict, ensure_ascii=False)
-        json_bytes = json_str.encode('utf-8')
-        logger.debug(f"Acknowledgment JSON length: {len(json_str)} chars, bytes: {len(json_bytes)}")
+        json_bytes = encode_json(json_dict)
+        self.logger.debug("Serialized acknowledgment for request %s: %d bytes", ack.id, len(json_bytes))
         
         # Prepend 4-byte length (little-endian int32)
-        length_bytes = struct.pack('<I', len(json_bytes))
-        
-        result = length_bytes + json_bytes
-        logger.debug(f"Total serialized acknowledgment: {len(result)} bytes")
-        return result
+        return LENGTH_PREFIX.pack(len(json_bytes)) + json_bytes
     
     def _write_message(self, data: bytes) -> None:
         """
@@ -207,25 +206,24 @@ class NamedPipeClient:
             PipeConnectionError: If write fails
         """
         try:
-            self.logger.debug(f"Writing {len(data)} bytes to pipe...")
-            
-            # Write in chunks if needed (Windows has limits)
-            chunk_size = 64 * 1024  # 64KB chunks
-            offset = 0
-            chunk_num = 0
-            
-            while offset < len(data):
-                chunk = data[offset:offset + chunk_size]
-                self.logger.debug(f"Writing chunk {chunk_num + 1}: {len(chunk)} bytes (offset: {offset})")
-                win32file.WriteFile(self._handle, chunk)
-                offset += len(chunk)
-                chunk_num += 1
+            # Named pipes take the whole message in one write; only a short write
+            # needs another call for the remainder (memoryview slices don't copy)
+            _, written = win32file.WriteFile(self._handle, data)
+            writes = 1
+            if written < len(data):
+                with memoryview(data) as view:
+                    while written < len(view):
+                        _, count = win32file.WriteFile(self._handle, view[written:])
+                        if count == 0:
+                            raise PipeConnectionError("Pipe connection broken during write")
+                        written += count
+                        writes += 1
             
-            self.logger.debug(f"Successfully wrote {len(data)} bytes in {chunk_num} chunk(s)")
+            self.logger.debug("Wrote %d bytes to pipe in %d write(s)", len(data), writes)
             
         except pywintypes.error as e:
-            self.logger.error(f"Error writing to pipe: {e}")
-            self.logger.debug(f"Error code: {e.winerror}, Error message: {e.strerror}")
+            self.logger.error("Error writing to pipe: %s", e)
+            self.logger.debug("Error code: %s, Error message: %s", e.winerror, e.strerror)
             raise PipeConnectionError(f"Error writing to pipe: {e}") from e
     
     def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Response:
@@ -242,67 +240,57 @@ class NamedPipeClient:
         Raises:
             PipeConnectionError: If communication fails
             ProtocolError: If protocol error occurs
+            TypeError: If params are not JSON-serializable
         """
-        self.logger.debug(f"call() invoked for method: {method}, params: {params}")
+        # Encode before touching the connection so unencodable params don't drop the pipe
+        request_id = self._get_next_request_id()
+        request_bytes = encode_request(request_id, method, params)
+        
         self._ensure_connected()
         
         with self._lock:
             try:
-                # Create request
-                request_id = self._get_next_request_id()
-                self.logger.debug(f"Generated request ID: {request_id}")
-                request = create_request(request_id, method, params)
-                self.logger.debug(f"Created request object: id={request.id}, method={request.method}, params={request.params}")
+                debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
                 
-                # Serialize and send
-                self.logger.debug("Serializing request...")
-                request_bytes = serialize_request(request)
-                self.logger.debug(f"Serialized request: {len(request_bytes)} bytes")
-                self.logger.debug(f"Sending request: {method} (ID: {request_id})")
-                self._write_message(request_bytes)
-                self.logger.debug("Request sent successfully, waiting for response...")
+                # Send the request
+                if debug_enabled:
+                    self.logger.debug("Sending request: %s (ID: %d), params: %s", method, request_id, params)
+                # The previous response's acknowledgment goes out in the same write as this request
+                self._write_message(self._pending_ack + request_bytes)
+                self._pending_ack = b""
                 
                 # Read response
-                self.logger.debug("Reading response from pipe...")
-                response_bytes = self._read_message()
-                self.logger.debug(f"Received response bytes: {len(response_bytes)} bytes")
-                
-                self.logger.debug("Deserializing response...")
-                response = deserialize_response(response_bytes)
-                self.logger.debug(f"Deserialized response: id={response.id}, has_error={response.error is not None}, has_result={response.result is not None}")
+                response = decode_response(self._read_message())
                 
                 # Verify response ID matches
                 if response.id != request_id:
-                    self.logger.warning(f"Response ID mismatch: expected {request_id}, got {response.id}")
-                else:
-                    self.logger.debug(f"Response ID matches request ID: {request_id}")
+                    self.logger.warning("Response ID mismatch: expected %d, got %d", request_id, response.id)
                 
-                if response.error:
-                    self.logger.debug(f"Response contains error: code={response.error.code}, message={response.error.message}")
-                else:
-                    self.logger.debug(f"Response contains result: {type(response.result)}")
+                if debug_enabled:
+                    if response.error:
+                        self.logger.debug("Response contains error: code=%s, message=%s", response.error.code, response.error.message)
+                    else:
+                        self.logger.debug("Response contains result: %s", type(response.result))
                 
-                # Send acknowledgment to server
+                # Queue the acknowledgment; it is sent with the next request or on disconnect
                 try:
-                    self.logger.debug(f"Sending acknowledgment for request ID: {request_id}")
                     ack = Acknowledgment(id=request_id, status="received")
-                    ack_bytes = self._serialize_acknowledgment(ack)
-                    self._write_message(ack_bytes)
-                    self.logger.debug(f"Acknowledgment sent for request ID: {request_id}")
+                    self._pending_ack = self._serialize_acknowledgment(ack)
                 except Exception as e:
-                    self.logger.warning(f"Failed to send acknowledgment: {e}")
+                    self.logger.warning("Failed to prepare acknowledgment: %s", e)
                     # Don't fail the call if ack fails
                 
                 return response
                 
             except (PipeConnectionError, ProtocolError) as e:
-                # Mark as disconnected on error
+                # Close the handle so unread data is discarded and the mod's single pipe
+                # instance is free for the reconnect
                 self.logger.error(f"Protocol/Connection error during call: {e}")
-                self._connected = False
+                self._close_handle()
                 raise
             except Exception as e:
                 self.logger.error(f"Unexpected error during call: {e}", exc_info=True)
-                self._connected = False
+                self._close_handle()
                 raise PipeConnectionError(f"Unexpected error during call: {e}") from e
     
     def call_with_retry(self, method: str, params: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> Response:
@@ -320,12 +308,10 @@ class NamedPipeClient:
         Raises:
             PipeConnectionError: If all retries fail
         """
-        self.logger.debug(f"call_with_retry: Starting call for method '{method}' with {max_retries} max retries")
         last_error = None
         
         for attempt in range(max_retries):
             try:
-                self.logger.debug(f"call_with_retry: Attempt {attempt + 1}/{max_retries} for method '{method}'")
                 return self.call(method, params)
             except PipeConnectionError as e:
                 last_error = e
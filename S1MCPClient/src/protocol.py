@@ -1,11 +1,18 @@
 """JSON-RPC protocol handling for Named Pipe communication."""
 
 import json
+import logging
 import struct
 from typing import Any, Dict, Optional
 
 from .models.request import Request
 from .models.response import Response, ErrorResponse
+from .utils.logger import get_logger
+
+try:
+    import orjson
+except ImportError:  # Optional: messages are encoded with the standard library json module
+    orjson = None
 
 
 class ProtocolError(Exception):
@@ -13,42 +20,114 @@ class ProtocolError(Exception):
     pass
 
 
+logger = get_logger()
+
+# Largest message payload the clients accept from the mod, in bytes
+MAX_MESSAGE_SIZE = 10 * 1024 * 1024
+
+# Every message is prefixed with its payload length as a little-endian uint32
+LENGTH_PREFIX = struct.Struct('<I')
+
+# JSON-RPC standard error codes
+JSON_RPC_ERROR_CODES = frozenset({
+    -32700,  # Parse error
+    -32600,  # Invalid Request
+    -32601,  # Method not found
+    -32602,  # Invalid params
+    -32603,  # Internal error
+})
+
+
+def encode_json(obj: Any) -> bytes:
+    """
+    Encode an object as UTF-8 JSON bytes, using orjson when it is installed.
+    
+    orjson rejects some values the standard library encodes (e.g. integers
+    beyond 64 bits); those fall back to json.dumps.
+    
+    Args:
+        obj: JSON-serializable object
+    
+    Returns:
+        Encoded JSON bytes
+    
+    Raises:
+        TypeError: If the object is not JSON-serializable
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj)
+        except TypeError:
+            pass
+    return json.dumps(obj, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+
+def decode_json(data: bytes | bytearray | memoryview) -> Any:
+    """
+    Decode UTF-8 JSON bytes, using orjson when it is installed.
+    
+    Args:
+        data: Encoded JSON bytes
+    
+    Returns:
+        Decoded object
+    
+    Raises:
+        json.JSONDecodeError: If the data is not valid JSON (orjson's error is a subclass)
+        UnicodeDecodeError: If the data is not valid UTF-8 (standard library only)
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
 def serialize_request(request: Request) -> bytes:
     """
     Serialize a request to the length-prefixed format.
     
     Format: [4 bytes: length] [JSON string]
     
+    Kept for callers that already hold a Request; the clients call
+    encode_request() with the fields directly.
+    
     Args:
         request: Request object to serialize
     
     Returns:
         Serialized message bytes
     """
-    import logging
-    logger = logging.getLogger("S1MCPClient")
+    return encode_request(request.id, request.method, request.params)
+
+
+def encode_request(request_id: int, method: str, params: Optional[Dict[str, Any]] = None) -> bytes:
+    """
+    Serialize request fields to the length-prefixed format without building a Request model.
+    
+    Args:
+        request_id: Unique request identifier
+        method: Method name
+        params: Optional parameters (sent as an empty object if omitted)
     
+    Returns:
+        Serialized message bytes
+    """
     # Convert to dict with camelCase keys
     json_dict = {
-        "id": request.id,
-        "method": request.method,
-        "params": request.params
+        "id": request_id,
+        "method": method,
+        "params": params or {}
     }
-    logger.debug(f"Serializing request: {json_dict}")
     
     # Serialize to JSON
-    json_str = json.dumps(json_dict, ensure_ascii=False)
-    json_bytes = json_str.encode('utf-8')
-    logger.debug(f"JSON string length: {len(json_str)} chars, bytes: {len(json_bytes)}")
-    logger.debug(f"JSON content: {json_str[:200]}..." if len(json_str) > 200 else f"JSON content: {json_str}")
+    json_bytes = encode_json(json_dict)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Serialized request %s (ID: %s): %d bytes", method, request_id, len(json_bytes))
+        logger.debug("JSON content: %.200s", json_bytes.decode('utf-8'))
     
     # Prepend 4-byte length (little-endian int32)
-    length_bytes = struct.pack('<I', len(json_bytes))
-    logger.debug(f"Length prefix: {len(json_bytes)} bytes (little-endian)")
-    
-    result = length_bytes + json_bytes
-    logger.debug(f"Total serialized message: {len(result)} bytes")
-    return result
+    return LENGTH_PREFIX.pack(len(json_bytes)) + json_bytes
 
 
 def deserialize_response(data: bytes) -> Response:
@@ -64,60 +143,78 @@ def deserialize_response(data: bytes) -> Response:
     Raises:
         ProtocolError: If deserialization fails
     """
-    import logging
-    logger = logging.getLogger("S1MCPClient")
-    
-    logger.debug(f"Deserializing response: {len(data)} total bytes")
-    
     if len(data) < 4:
         raise ProtocolError(f"Message too short: missing length prefix (got {len(data)} bytes)")
     
     # Extract length prefix (little-endian int32)
-    message_length = struct.unpack('<I', data[:4])[0]
-    logger.debug(f"Message length from prefix: {message_length} bytes")
+    message_length = LENGTH_PREFIX.unpack_from(data)[0]
     
     if len(data) < 4 + message_length:
         raise ProtocolError(f"Message incomplete: expected {4 + message_length} bytes, got {len(data)}")
     
-    # Extract JSON payload
-    json_bytes = data[4:4 + message_length]
-    logger.debug(f"Extracted JSON payload: {len(json_bytes)} bytes")
+    return decode_response(data[4:4 + message_length])
+
+
+def decode_response(json_bytes: bytes | bytearray | memoryview) -> Response:
+    """
+    Deserialize a response from its JSON payload (without the length prefix).
+    
+    Args:
+        json_bytes: JSON payload bytes
+    
+    Returns:
+        Deserialized Response object
     
-    json_str = json_bytes.decode('utf-8')
-    logger.debug(f"Decoded JSON string: {len(json_str)} chars")
-    logger.debug(f"JSON content: {json_str[:200]}..." if len(json_str) > 200 else f"JSON content: {json_str}")
+    Raises:
+        ProtocolError: If deserialization fails
+    """
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Deserializing response: %d bytes", len(json_bytes))
+        logger.debug("JSON content: %s", bytes(json_bytes[:200]).decode('utf-8', errors='replace'))
     
-    # Parse JSON
+    # Parse JSON straight from the bytes
     try:
-        json_dict = json.loads(json_str)
-        logger.debug(f"Parsed JSON dict: {json_dict}")
-    except json.JSONDecodeError as e:
-        logger.error(f"JSON decode error: {e}")
-        logger.debug(f"Failed JSON string: {json_str}")
+        json_dict = decode_json(json_bytes)
+    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+        logger.error("JSON decode error: %s", e)
         raise ProtocolError(f"Invalid JSON: {e}") from e
     
     # Convert to Response object
+    return response_from_dict(json_dict)
+
+
+def response_from_dict(json_dict: Dict[str, Any]) -> Response:
+    """
+    Build a Response object from a decoded JSON response.
+    
+    Args:
+        json_dict: Decoded response JSON object
+    
+    Returns:
+        Response object
+    
+    Raises:
+        ProtocolError: If the response structure is invalid
+    """
     try:
         error = None
         if json_dict.get("error"):
             error_data = json_dict["error"]
-            logger.debug(f"Response contains error: {error_data}")
+            logger.debug("Response contains error: %s", error_data)
             error = ErrorResponse(
                 code=error_data.get("code", -32603),
                 message=error_data.get("message", "Internal error"),
                 data=error_data.get("data")
             )
         
-        response = Response(
+        return Response(
             id=json_dict.get("id", 0),
             result=json_dict.get("result"),
             error=error
         )
-        logger.debug(f"Created Response object: id={response.id}, has_error={response.error is not None}, has_result={response.result is not None}")
-        return response
-    except (KeyError, TypeError) as e:
-        logger.error(f"Error creating Response object: {e}")
-        logger.debug(f"JSON dict: {json_dict}")
+    except (AttributeError, KeyError, TypeError) as e:
+        logger.error("Error creating Response object: %s", e)
+        logger.debug("JSON dict: %s", json_dict)
         raise ProtocolError(f"Invalid response structure: {e}") from e
 
 
@@ -125,6 +222,8 @@ def create_request(request_id: int, method: str, params: Optional[Dict[str, Any]
     """
     Create a request object.
     
+    Not needed for sending requests; encode_request() serializes the fields directly.
+    
     Args:
         request_id: Unique request identifier
         method: Method name
@@ -150,23 +249,9 @@ def map_error_code(mod_error_code: int) -> int:
     Returns:
         Mapped error code
     """
-    # JSON-RPC standard error codes
-    json_rpc_errors = {
-        -32700: -32700,  # Parse error
-        -32600: -32600,  # Invalid Request
-        -32601: -32601,  # Method not found
-        -32602: -32602,  # Invalid params
-        -32603: -32603,  # Internal error
-    }
-    
-    # Game-specific error codes (keep as-is, but ensure they're in valid range)
-    if mod_error_code in json_rpc_errors:
-        return mod_error_code
-    
-    # Game-specific errors (-32000 to -32099)
-    if -32099 <= mod_error_code <= -32000:
+    # JSON-RPC standard codes and game-specific errors (-32000 to -32099) are kept as-is
+    if mod_error_code in JSON_RPC_ERROR_CODES or -32099 <= mod_error_code <= -32000:
         return mod_error_code
     
     # Default to internal error for unknown codes
     return -32603
-
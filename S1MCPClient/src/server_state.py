@@ -0,0 +1,20 @@
+"""Runtime state shared by the MCP server and its tool modules."""
+
+import asyncio
+from dataclasses import dataclass
+
+
+@dataclass(slots=True)
+class ServerState:
+    """Connection state of the running MCP server."""
+
+    # Whether the mod is connected and answered the handshake
+    connected: bool = False
+    # Instructions for the LLM provided by the mod's handshake
+    instructions: str | None = None
+    # Set once the startup connection attempt and handshake have finished
+    connection_ready: asyncio.Event | None = None
+
+
+# The single state instance; updated by main and the game lifecycle tools
+server_state = ServerState()
@@ -1,16 +1,19 @@
 """TCP client for communicating with the mod."""
 
+import asyncio
+import itertools
+import logging
+import random
 import socket
-import struct
 import threading
 import time
-from typing import Any, Dict, Optional
-import json
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional, Tuple
 
-from .models.request import Request
 from .models.response import Response
 from .models.acknowledgment import Acknowledgment
-from .protocol import serialize_request, deserialize_response, ProtocolError, create_request
+from .protocol import encode_request, decode_response, response_from_dict, encode_json, ProtocolError, LENGTH_PREFIX, MAX_MESSAGE_SIZE
+from .call_batcher import McpCallBatcher
 from .utils.logger import get_logger
 
 
@@ -19,10 +22,27 @@ class TcpConnectionError(Exception):
     pass
 
 
+# Responses up to this size are received into a buffer reused across calls
+RECV_BUFFER_SIZE = 64 * 1024
+
+# Acknowledgment body for the "received" status; only the request ID varies
+_RECEIVED_ACK_TEMPLATE = b'{"id":%d,"status":"received"}'
+
+# Upper bound in seconds for the backoff between call_with_retry attempts
+MAX_RETRY_DELAY = 5.0
+
+# Seconds between heartbeats; a heartbeat is only sent if no call was made in that time
+HEARTBEAT_INTERVAL = 60.0
+
+# Kernel keepalive probing (idle seconds before the first probe, seconds between probes,
+# failed probes before the connection is dropped), applied where the platform supports it
+TCP_KEEPALIVE_OPTIONS = (("TCP_KEEPIDLE", 60), ("TCP_KEEPINTVL", 10), ("TCP_KEEPCNT", 3))
+
+
 class TcpClient:
     """TCP client for mod communication."""
     
-    def __init__(self, host: str = "localhost", port: int = 8765, timeout: float = 5.0, reconnect_delay: float = 1.0):
+    def __init__(self, host: str = "localhost", port: int = 8765, timeout: float = 5.0, reconnect_delay: float = 1.0, batch_window: float = 0.005):
         """
         Initialize the TCP client.
         
@@ -30,21 +50,31 @@ class TcpClient:
             host: Server hostname or IP address
             port: Server port number
             timeout: Connection timeout in seconds
-            reconnect_delay: Delay before reconnection attempts in seconds
+            reconnect_delay: Base delay before reconnection attempts in seconds (call_with_retry doubles it per attempt)
+            batch_window: Seconds call_batched() waits for other calls to share a batch with (0 disables batching)
         """
         self.host = host
         self.port = port
         self.timeout = timeout
         self.reconnect_delay = reconnect_delay
+        self.batch_window = batch_window
         self.logger = get_logger()
         
         self._socket: Optional[socket.socket] = None
         self._connected = False
         self._lock = threading.RLock()  # Use reentrant lock to allow nested calls
-        self._request_id_counter = 0
-        self._request_id_lock = threading.Lock()
+        # next() on itertools.count is atomic under the GIL, so no lock is needed
+        self._request_ids = itertools.count(1)
         self._heartbeat_thread: Optional[threading.Thread] = None
         self._heartbeat_stop_event = threading.Event()
+        self._reconnect_thread: Optional[threading.Thread] = None
+        self._reconnect_stop_event = threading.Event()
+        self._batcher: Optional[McpCallBatcher] = None
+        # Reads happen under _lock, so one receive buffer can serve every call
+        self._recv_buffer = bytearray(RECV_BUFFER_SIZE)
+        self._header_buffer = bytearray(4)
+        # time.monotonic() of the last completed call, so idle heartbeats can be skipped
+        self._last_call_time = 0.0
     
     def connect(self) -> None:
         """
@@ -58,10 +88,19 @@ class TcpClient:
                 self.logger.debug("Already connected to TCP server")
                 return
             
+            self._reconnect_stop_event.clear()
+            
             try:
                 self.logger.debug(f"Attempting to connect to TCP server: {self.host}:{self.port}")
                 self.logger.debug(f"Connection timeout: {self.timeout}s")
                 
+                # Drop the socket left behind by a failed call, if any
+                if self._socket is not None:
+                    try:
+                        self._socket.close()
+                    except OSError:
+                        pass
+                
                 # Create socket
                 self.logger.debug("Creating TCP socket...")
                 self._socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -75,6 +114,7 @@ class TcpClient:
                 
                 # Disable Nagle's algorithm for lower latency
                 self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                self._enable_keepalive()
                 
                 # After connection, set a longer timeout for read operations (90 seconds)
                 # This allows for heartbeat intervals (60s) plus some buffer
@@ -109,6 +149,9 @@ class TcpClient:
     
     def disconnect(self) -> None:
         """Disconnect from the TCP server."""
+        # An explicit disconnect cancels any background reconnect
+        self._reconnect_stop_event.set()
+        
         # Stop heartbeat thread
         self._stop_heartbeat()
         
@@ -128,64 +171,80 @@ class TcpClient:
                 self._connected = False
                 self.logger.debug("Disconnect called but socket was already None")
     
+    def _enable_keepalive(self) -> None:
+        """Let the kernel detect a dead connection instead of waiting for the next call to fail."""
+        self._socket.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        for name, value in TCP_KEEPALIVE_OPTIONS:
+            option = getattr(socket, name, None)
+            if option is None:
+                continue
+            try:
+                self._socket.setsockopt(socket.IPPROTO_TCP, option, value)
+            except OSError as e:
+                self.logger.debug("Could not set %s: %s", name, e)
+    
     def is_connected(self) -> bool:
         """Check if connected to the server."""
         with self._lock:
             return self._connected and self._socket is not None
     
     def _ensure_connected(self) -> None:
-        """Ensure we're connected, reconnect if necessary."""
-        if not self.is_connected():
+        """Ensure we're connected, reconnect if necessary. Must be called with _lock held."""
+        if not (self._connected and self._socket is not None):
             self.logger.debug("_ensure_connected: Not connected, attempting to connect...")
             self.connect()
-        else:
-            self.logger.debug("_ensure_connected: Already connected")
     
     def _get_next_request_id(self) -> int:
         """Get the next request ID (thread-safe)."""
-        with self._request_id_lock:
-            self._request_id_counter += 1
-            return self._request_id_counter
+        return next(self._request_ids)
     
-    def _read_message(self) -> bytes:
+    def _read_message(self) -> memoryview | bytearray:
         """
         Read a complete message from the socket.
         
+        Messages that fit are received into the shared receive buffer, so the
+        returned view is only valid until the next read; decode it before then.
+        
         Returns:
-            Complete message bytes (length prefix + JSON)
+            JSON payload bytes (without the length prefix)
         
         Raises:
             TcpConnectionError: If read fails
         """
         try:
-            self.logger.debug("Reading message from socket...")
-            
-            # Read 4-byte length prefix
-            self.logger.debug("Reading 4-byte length prefix...")
-            length_bytes = self._socket.recv(4)
-            self.logger.debug(f"Read {len(length_bytes)} bytes for length prefix")
+            recv_into = self._socket.recv_into
             
-            if len(length_bytes) != 4:
-                raise TcpConnectionError(f"Failed to read message length: got {len(length_bytes)} bytes instead of 4")
+            # Read 4-byte length prefix; like the body, it may arrive in pieces
+            header = self._header_buffer
+            received = 0
+            while received < 4:
+                count = recv_into(memoryview(header)[received:])
+                if count == 0:
+                    raise TcpConnectionError(f"Failed to read message length: got {received} bytes instead of 4")
+                received += count
             
-            message_length = struct.unpack('<I', length_bytes)[0]
-            self.logger.debug(f"Message length: {message_length} bytes")
+            message_length = LENGTH_PREFIX.unpack_from(header)[0]
             
-            if message_length < 0 or message_length > 10 * 1024 * 1024:  # Max 10MB
-                raise TcpConnectionError(f"Invalid message length: {message_length}")
+            if message_length > MAX_MESSAGE_SIZE:
+                raise TcpConnectionError(f"Message too large: {message_length} bytes (max {MAX_MESSAGE_SIZE})")
             
-            # Read JSON message
-            self.logger.debug(f"Reading {message_length} bytes of JSON message...")
-            message_bytes = b''
-            while len(message_bytes) < message_length:
-                chunk = self._socket.recv(message_length - len(message_bytes))
-                if not chunk:
-                    raise TcpConnectionError(f"Socket closed before message complete (read {len(message_bytes)}/{message_length} bytes)")
-                message_bytes += chunk
-                self.logger.debug(f"Read {len(message_bytes)}/{message_length} bytes so far")
+            # Read JSON message straight into the receive buffer, or a one-off
+            # buffer of the final size for large messages
+            if message_length <= RECV_BUFFER_SIZE:
+                message = memoryview(self._recv_buffer)[:message_length]
+            else:
+                message = bytearray(message_length)
+            with memoryview(message) as view:
+                received = 0
+                while received < message_length:
+                    count = recv_into(view[received:])
+                    if count == 0:
+                        raise TcpConnectionError(f"Socket closed before message complete (read {received}/{message_length} bytes)")
+                    received += count
             
-            self.logger.debug(f"Complete message read: {len(length_bytes + message_bytes)} total bytes")
-            return length_bytes + message_bytes
+            self.logger.debug("Complete message read: %d bytes", message_length)
+            # The JSON decoders read the buffer directly, so no final copy is needed
+            return message
             
         except socket.timeout as e:
             self.logger.error(f"Socket read timeout: {e}")
@@ -205,18 +264,9 @@ class TcpClient:
             TcpConnectionError: If write fails
         """
         try:
-            self.logger.debug(f"Writing {len(data)} bytes to socket...")
-            
-            # Write all data
-            total_sent = 0
-            while total_sent < len(data):
-                sent = self._socket.send(data[total_sent:])
-                if sent == 0:
-                    raise TcpConnectionError("Socket connection broken during write")
-                total_sent += sent
-                self.logger.debug(f"Sent {total_sent}/{len(data)} bytes")
-            
-            self.logger.debug(f"Successfully wrote {len(data)} bytes")
+            # sendall loops over partial sends in C, without slicing the data
+            self._socket.sendall(data)
+            self.logger.debug("Wrote %d bytes to socket", len(data))
             
         except socket.error as e:
             self.logger.error(f"Error writing to socket: {e}")
@@ -232,26 +282,14 @@ class TcpClient:
         Returns:
             Serialized message bytes
         """
-        logger = self.logger
-        
-        # Convert to dict
-        json_dict = {
-            "id": ack.id,
-            "status": ack.status
-        }
-        logger.debug(f"Serializing acknowledgment: {json_dict}")
-        
-        # Serialize to JSON
-        json_str = json.dumps(json_dict, ensure_ascii=False)
-        json_bytes = json_str.encode('utf-8')
-        logger.debug(f"Acknowledgment JSON length: {len(json_str)} chars, bytes: {len(json_bytes)}")
+        if ack.status == "received":
+            # Fixed shape for the status sent after every call - skip the JSON encoder
+            json_bytes = _RECEIVED_ACK_TEMPLATE % ack.id
+        else:
+            json_bytes = encode_json({"id": ack.id, "status": ack.status})
         
         # Prepend 4-byte length (little-endian int32)
-        length_bytes = struct.pack('<I', len(json_bytes))
-        
-        result = length_bytes + json_bytes
-        logger.debug(f"Total serialized acknowledgment: {len(result)} bytes")
-        return result
+        return LENGTH_PREFIX.pack(len(json_bytes)) + json_bytes
     
     def call(self, method: str, params: Optional[Dict[str, Any]] = None) -> Response:
         """
@@ -267,81 +305,61 @@ class TcpClient:
         Raises:
             TcpConnectionError: If communication fails
             ProtocolError: If protocol error occurs
+            TypeError: If params are not JSON-serializable
         """
-        self.logger.debug(f"call() invoked for method: {method}, params: {params}")
-        self._ensure_connected()
+        # Encode before touching the connection so unencodable params don't drop the socket
+        request_id = self._get_next_request_id()
+        request_bytes = encode_request(request_id, method, params)
         
         with self._lock:
+            self._ensure_connected()
             try:
-                # Create request
-                request_id = self._get_next_request_id()
-                self.logger.debug(f"Generated request ID: {request_id}")
-                request = create_request(request_id, method, params)
-                self.logger.debug(f"Created request object: id={request.id}, method={request.method}, params={request.params}")
+                debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
                 
-                # Serialize and send
-                self.logger.debug("Serializing request...")
-                request_bytes = serialize_request(request)
-                self.logger.debug(f"Serialized request: {len(request_bytes)} bytes")
-                self.logger.debug(f"Sending request: {method} (ID: {request_id})")
+                # Send the request
+                if debug_enabled:
+                    self.logger.debug("Sending request: %s (ID: %d), params: %s", method, request_id, params)
                 self._write_message(request_bytes)
-                self.logger.debug("Request sent successfully, waiting for response...")
-                
-                # Read response
-                self.logger.debug("Reading response from socket...")
-                response_bytes = self._read_message()
-                self.logger.debug(f"Received response bytes: {len(response_bytes)} bytes")
                 
-                self.logger.debug("Deserializing response...")
-                response = deserialize_response(response_bytes)
-                self.logger.debug(f"Deserialized response: id={response.id}, has_error={response.error is not None}, has_result={response.result is not None}")
+                # Read response, skipping any heartbeats the mod queued while we were idle
+                while True:
+                    response = decode_response(self._read_message())
+                    if not _is_server_heartbeat(response):
+                        break
+                    if debug_enabled:
+                        self.logger.debug("Skipping server-initiated heartbeat (ID: %d) while waiting for request %d", response.id, request_id)
                 
                 # Verify response ID matches
                 if response.id != request_id:
-                    # Check if it's a server-initiated heartbeat
-                    if (response.result and 
-                        isinstance(response.result, dict) and 
-                        response.result.get("type") == "server_heartbeat"):
-                        self.logger.debug(f"Received server-initiated heartbeat (ID: {response.id}), continuing to wait for response to request {request_id}")
-                        # This is a server heartbeat, not our response - continue waiting
-                        # Read the next message (our actual response)
-                        response_bytes = self._read_message()
-                        response = deserialize_response(response_bytes)
-                        # Verify this one matches
-                        if response.id != request_id:
-                            self.logger.warning(f"Response ID mismatch after server heartbeat: expected {request_id}, got {response.id}")
-                        else:
-                            self.logger.debug(f"Response ID matches request ID: {request_id}")
+                    self.logger.warning("Response ID mismatch: expected %d, got %d", request_id, response.id)
+                
+                if debug_enabled:
+                    if response.error:
+                        self.logger.debug("Response contains error: code=%s, message=%s", response.error.code, response.error.message)
                     else:
-                        self.logger.warning(f"Response ID mismatch: expected {request_id}, got {response.id}")
-                else:
-                    self.logger.debug(f"Response ID matches request ID: {request_id}")
+                        self.logger.debug("Response contains result: %s", type(response.result))
                 
-                if response.error:
-                    self.logger.debug(f"Response contains error: code={response.error.code}, message={response.error.message}")
-                else:
-                    self.logger.debug(f"Response contains result: {type(response.result)}")
+                self._last_call_time = time.monotonic()
                 
                 # Send acknowledgment to server
                 try:
-                    self.logger.debug(f"Sending acknowledgment for request ID: {request_id}")
                     ack = Acknowledgment(id=request_id, status="received")
                     ack_bytes = self._serialize_acknowledgment(ack)
                     
                     # Set a shorter timeout for acknowledgment write
-                    old_timeout = self._socket.gettimeout()
-                    self._socket.settimeout(5.0)
+                    sock = self._socket
+                    old_timeout = sock.gettimeout()
+                    sock.settimeout(5.0)
                     try:
                         self._write_message(ack_bytes)
-                        self.logger.debug(f"Acknowledgment sent for request ID: {request_id}")
                     finally:
                         # Restore original timeout
-                        self._socket.settimeout(old_timeout)
+                        sock.settimeout(old_timeout)
                 except socket.timeout:
-                    self.logger.warning(f"Acknowledgment send timeout for request ID: {request_id}")
+                    self.logger.warning("Acknowledgment send timeout for request ID: %d", request_id)
                     # Don't fail the call if ack times out
                 except Exception as e:
-                    self.logger.warning(f"Failed to send acknowledgment: {e}")
+                    self.logger.warning("Failed to send acknowledgment: %s", e)
                     # Don't fail the call if ack fails
                 
                 return response
@@ -350,10 +368,12 @@ class TcpClient:
                 # Mark as disconnected on error
                 self.logger.error(f"Protocol/Connection error during call: {e}")
                 self._connected = False
+                self._start_reconnect()
                 raise
             except Exception as e:
                 self.logger.error(f"Unexpected error during call: {e}", exc_info=True)
                 self._connected = False
+                self._start_reconnect()
                 raise TcpConnectionError(f"Unexpected error during call: {e}") from e
     
     def call_with_retry(self, method: str, params: Optional[Dict[str, Any]] = None, max_retries: int = 3) -> Response:
@@ -371,19 +391,21 @@ class TcpClient:
         Raises:
             TcpConnectionError: If all retries fail
         """
-        self.logger.debug(f"call_with_retry: Starting call for method '{method}' with {max_retries} max retries")
         last_error = None
         
         for attempt in range(max_retries):
             try:
-                self.logger.debug(f"call_with_retry: Attempt {attempt + 1}/{max_retries} for method '{method}'")
                 return self.call(method, params)
             except TcpConnectionError as e:
                 last_error = e
                 self.logger.warning(f"call_with_retry: Attempt {attempt + 1}/{max_retries} failed: {e}")
                 if attempt < max_retries - 1:
-                    self.logger.debug(f"call_with_retry: Waiting {self.reconnect_delay}s before retry...")
-                    time.sleep(self.reconnect_delay)
+                    # Retry a first failure straight away (usually a connection that had
+                    # already dropped), then back off exponentially with jitter
+                    if attempt > 0:
+                        delay = min(self.reconnect_delay * 2 ** (attempt - 1), MAX_RETRY_DELAY) * random.uniform(0.5, 1.5)
+                        self.logger.debug("call_with_retry: Waiting %.2fs before retry...", delay)
+                        time.sleep(delay)
                     try:
                         self.logger.debug("call_with_retry: Disconnecting before retry...")
                         self.disconnect()
@@ -401,6 +423,71 @@ class TcpClient:
         self.logger.error(f"call_with_retry: Giving up after {max_retries} failed attempts")
         raise last_error or TcpConnectionError("Call failed with unknown error")
     
+    def call_batch(self, calls: List[Tuple[str, Optional[Dict[str, Any]]]]) -> List[Response]:
+        """
+        Call several methods in a single round-trip using the mod's "batch" method.
+        
+        Args:
+            calls: (method, params) pairs to call
+        
+        Returns:
+            One Response per call, in the same order. If the batch request itself
+            fails, every entry carries that error.
+        
+        Raises:
+            TcpConnectionError: If all retries fail
+            ProtocolError: If the batch response is malformed
+        """
+        batch_params = {
+            "requests": [
+                {"id": index, "method": method, "params": params or {}}
+                for index, (method, params) in enumerate(calls)
+            ]
+        }
+        batch_response = self.call_with_retry("batch", batch_params)
+        
+        if batch_response.error is not None:
+            return [Response(id=index, error=batch_response.error) for index in range(len(calls))]
+        
+        raw_responses = (batch_response.result or {}).get("responses")
+        if not isinstance(raw_responses, list):
+            raise ProtocolError("Batch response is missing the 'responses' list")
+        
+        responses_by_id = {}
+        for raw in raw_responses:
+            response = response_from_dict(raw)
+            responses_by_id[response.id] = response
+        
+        missing = [index for index in range(len(calls)) if index not in responses_by_id]
+        if missing:
+            raise ProtocolError(f"Batch response is missing entries: {missing}")
+        
+        return [responses_by_id[index] for index in range(len(calls))]
+    
+    async def call_batched(self, method: str, params: Optional[Dict[str, Any]] = None) -> Response:
+        """
+        Call a method without blocking the event loop, sharing the round-trip with concurrent calls.
+        
+        Calls made within batch_window of each other are sent to the mod as one batch.
+        With a batch_window of 0 every call gets its own round-trip.
+        
+        Args:
+            method: Method name
+            params: Optional parameters
+        
+        Returns:
+            Response object
+        
+        Raises:
+            TcpConnectionError: If communication fails
+            ProtocolError: If protocol error occurs
+        """
+        if self.batch_window <= 0:
+            return await asyncio.to_thread(self.call_with_retry, method, params)
+        if self._batcher is None:
+            self._batcher = McpCallBatcher(self, max_wait=self.batch_window)
+        return await self._batcher.call(method, params)
+    
     def __enter__(self):
         """Context manager entry."""
         self.connect()
@@ -432,9 +519,36 @@ class TcpClient:
         self._heartbeat_thread = None
         self.logger.debug("Heartbeat thread stopped")
     
+    def _start_reconnect(self) -> None:
+        """Start reconnecting in the background so the next call finds a ready connection."""
+        if self._reconnect_stop_event.is_set():
+            return
+        if self._reconnect_thread is not None and self._reconnect_thread.is_alive():
+            return
+        
+        self._reconnect_thread = threading.Thread(target=self._reconnect_loop, daemon=True)
+        self._reconnect_thread.start()
+        self.logger.debug("Reconnect thread started")
+    
+    def _reconnect_loop(self, max_attempts: int = 3) -> None:
+        """Try to re-establish a dropped connection a few times, backing off between attempts."""
+        for attempt in range(1, max_attempts + 1):
+            if self._reconnect_stop_event.wait(timeout=self.reconnect_delay * attempt):
+                break
+            if self.is_connected():
+                break
+            try:
+                self.connect()
+                self.logger.info("Reconnected to TCP server in the background")
+                break
+            except TcpConnectionError as e:
+                self.logger.debug(f"Background reconnect attempt {attempt}/{max_attempts} failed: {e}")
+        
+        self.logger.debug("Reconnect loop ended")
+    
     def _heartbeat_loop(self) -> None:
         """Heartbeat loop that sends periodic heartbeat messages."""
-        heartbeat_interval = 60.0  # 60 seconds
+        heartbeat_interval = HEARTBEAT_INTERVAL
         self.logger.debug(f"Heartbeat loop started (interval: {heartbeat_interval}s)")
         
         while not self._heartbeat_stop_event.is_set():
@@ -449,17 +563,18 @@ class TcpClient:
                     self.logger.debug("Heartbeat: Not connected, skipping heartbeat")
                     continue
                 
-                # Check if lock is held (tool call in progress) - if so, skip this heartbeat
-                # We can't use acquire(timeout) on a regular Lock to check without blocking
-                # Instead, we'll just try the heartbeat and let it fail gracefully if lock is held
+                # Tool calls already prove the connection is alive
+                if time.monotonic() - self._last_call_time < heartbeat_interval:
+                    continue
+                
+                # A call in flight is as good as a heartbeat - skip instead of queueing behind it
+                if not self._lock.acquire(blocking=False):
+                    continue
                 try:
-                    # Send heartbeat request - use call_with_retry with minimal retries
-                    # If a tool call is in progress, this will wait briefly then fail gracefully
                     self.logger.debug("Sending heartbeat to server...")
                     try:
-                        # Use call_with_retry with 1 retry max and shorter timeout
-                        # This will fail quickly if lock is held or connection is bad
-                        response = self.call_with_retry("heartbeat", {}, max_retries=1)
+                        # A single attempt; a failed call already schedules a background reconnect
+                        response = self.call("heartbeat", {})
                         
                         if response.error:
                             self.logger.debug(f"Heartbeat error: {response.error.message}")
@@ -469,12 +584,10 @@ class TcpClient:
                         self.logger.debug(f"Heartbeat connection error (will retry next interval): {e}")
                         # Connection lost, but don't break loop - it might recover
                     except Exception as e:
-                        # This might include lock timeout or other issues - just log and continue
                         self.logger.debug(f"Error sending heartbeat (will retry next interval): {e}")
                         # Don't break the loop - connection might recover
-                except Exception as e:
-                    self.logger.debug(f"Error in heartbeat send attempt: {e}")
-                    # Don't break the loop - connection might recover
+                finally:
+                    self._lock.release()
                     
             except Exception as e:
                 self.logger.debug(f"Error in heartbeat loop: {e}")
@@ -486,3 +599,12 @@ class TcpClient:
         
         self.logger.debug("Heartbeat loop ended")
 
+
+def _is_server_heartbeat(response: Response) -> bool:
+    """Check whether a message is a heartbeat the mod sent on its own rather than a reply."""
+    result = response.result
+    return isinstance(result, dict) and result.get("type") == "server_heartbeat"
+
+
+# Client the tool handlers talk to; set by create_server
+tcp_client_ctx: ContextVar[TcpClient] = ContextVar("tcp_client")
@@ -1,2 +1,37 @@
-"""MCP tool definitions for S1MCPClient."""
+"""
+MCP tool definitions for S1MCPClient.
 
+Each tool module exposes:
+    get_<module>(): The module's Tool definitions. They never change, so each
+        module builds them on first use and returns the same tuple afterwards.
+    TOOL_HANDLERS: Handler coroutine per tool name.
+    READ_ONLY_TOOLS: Optional; tools that only read game state, whose results
+        may be served from the short-lived call cache.
+    STATIC_TOOLS: Optional; read-only tools whose results can't change while
+        the game runs, cached for longer.
+"""
+
+import importlib
+
+
+# Tool submodules, imported on first attribute access (PEP 562)
+_SUBMODULES = {
+    "npc_tools",
+    "player_tools",
+    "item_tools",
+    "property_tools",
+    "vehicle_tools",
+    "game_state_tools",
+    "debug_tools",
+    "log_tools",
+    "game_lifecycle_tools",
+    "load_manager_tools",
+    "s1api_docs_tools",
+}
+
+
+def __getattr__(name: str):
+    """Import a tool submodule the first time it is accessed."""
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,6 +1,7 @@
 """Game lifecycle management MCP tools."""
 
 import asyncio
+import json
 import os
 import subprocess
 import time
@@ -8,80 +9,84 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient, TcpConnectionError
+from ..server_state import server_state
+from ..tcp_client import TcpClient, TcpConnectionError, tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 from ..utils.config import Config
 
 
 logger = get_logger()
 
 
-def get_game_lifecycle_tools(tcp_client: TcpClient, config: Config) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_game_lifecycle_tools() -> tuple[Tool, ...]:
     """
     Get all Game Lifecycle MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-        config: Configuration instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_launch_game",
-            description=(
-                "Launch the Schedule I game with specified version (IL2CPP or Mono) and optional debugging. "
-                "Automatically waits for the game to start and establishes connection to the mod server. "
-                "Use this to start the game before testing mods."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "version": {
-                        "type": "string",
-                        "enum": ["il2cpp", "mono"],
-                        "description": "Game version to launch: 'il2cpp' or 'mono'"
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_launch_game",
+                description=(
+                    "Launch the Schedule I game with specified version (IL2CPP or Mono) and optional debugging. "
+                    "Automatically waits for the game to start and establishes connection to the mod server. "
+                    "Use this to start the game before testing mods."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "version": {
+                            "type": "string",
+                            "enum": ["il2cpp", "mono"],
+                            "description": "Game version to launch: 'il2cpp' or 'mono'"
+                        },
+                        "enable_debugger": {
+                            "type": "boolean",
+                            "description": "Enable MelonLoader debugger (adds --melonloader.launchdebugger --melonloader.debug flags)",
+                            "default": False
+                        },
+                        "wait_for_connection": {
+                            "type": "boolean",
+                            "description": "Wait for game to start and automatically connect to the mod server",
+                            "default": True
+                        }
                     },
-                    "enable_debugger": {
-                        "type": "boolean",
-                        "description": "Enable MelonLoader debugger (adds --melonloader.launchdebugger --melonloader.debug flags)",
-                        "default": False
-                    },
-                    "wait_for_connection": {
-                        "type": "boolean",
-                        "description": "Wait for game to start and automatically connect to the mod server",
-                        "default": True
-                    }
-                },
-                "required": ["version"]
-            }
-        ),
-        Tool(
-            name="s1_close_game",
-            description=(
-                "Forcefully close the Schedule I game. "
-                "Use this to terminate the game after testing or before relaunching with different settings."
+                    "required": ["version"]
+                }
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_get_game_process_info",
-            description=(
-                "Check if the Schedule I game is currently running and get process information. "
-                "Returns running status, process ID(s), and resource usage."
+            Tool(
+                name="s1_close_game",
+                description=(
+                    "Forcefully close the Schedule I game. "
+                    "Use this to terminate the game after testing or before relaunching with different settings."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_get_game_process_info",
+                description=(
+                    "Check if the Schedule I game is currently running and get process information. "
+                    "Returns running status, process ID(s), and resource usage."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
         )
-    ]
+    return _TOOLS_CACHE
 
 
 # Helper functions
@@ -162,7 +167,6 @@ def _get_game_process_info() -> Dict[str, Any]:
         )
         
         if result.returncode == 0 and result.stdout.strip():
-            import json
             processes = json.loads(result.stdout)
             
             # Handle single process (not array) or array of processes
@@ -263,11 +267,11 @@ async def _poll_connection(tcp_client: TcpClient, timeout: float, interval: floa
             
             # Try to connect
             logger.debug(f"Attempting fresh connection to {tcp_client.host}:{tcp_client.port}...")
-            tcp_client.connect()
+            await asyncio.to_thread(tcp_client.connect)
             logger.debug("Connection established, performing handshake...")
             
             # Perform handshake to verify connection
-            response = tcp_client.call("handshake", {})
+            response = await asyncio.to_thread(tcp_client.call, "handshake", {})
             
             if response.error:
                 logger.debug(f"Handshake failed: {response.error.message}")
@@ -320,8 +324,9 @@ async def _poll_connection(tcp_client: TcpClient, timeout: float, interval: floa
 
 # Tool handlers
 
-async def handle_s1_launch_game(arguments: Dict[str, Any], tcp_client: TcpClient, config: Config) -> list[TextContent]:
+async def handle_s1_launch_game(arguments: Dict[str, Any], config: Config) -> list[TextContent]:
     """Handle s1_launch_game tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
         version = arguments.get("version", "").lower()
         enable_debugger = arguments.get("enable_debugger", False)
@@ -453,27 +458,21 @@ async def handle_s1_launch_game(arguments: Dict[str, Any], tcp_client: TcpClient
                 response_text += f"✓ Connected to game server after {connection_result['elapsed_time']}s "
                 response_text += f"({connection_result['attempts']} attempts)\n"
                 
-                # Update global connection state in main module
-                try:
-                    import sys
-                    main_module = sys.modules.get('__main__') or sys.modules.get('s1mcpclient.src.main')
-                    if main_module and hasattr(main_module, 'is_connected'):
-                        main_module.is_connected = True
-                        logger.info("Updated global connection state to connected")
-                    
-                    # Also update server_instructions if available
-                    if "server_info" in connection_result and connection_result["server_info"]:
-                        server_info = connection_result["server_info"]
-                        if isinstance(server_info, dict):
-                            response_text += f"  Server: {server_info.get('server_name', 'Unknown')} "
-                            response_text += f"v{server_info.get('version', 'Unknown')}\n"
-                            
-                            # Store instructions if available
-                            if "instructions" in server_info and hasattr(main_module, 'server_instructions'):
-                                main_module.server_instructions = server_info["instructions"]
-                                logger.info(f"Received and stored server instructions ({len(server_info['instructions'])} chars)")
-                except Exception as e:
-                    logger.warning(f"Could not update global connection state: {e}")
+                # Update shared connection state
+                server_state.connected = True
+                logger.info("Updated global connection state to connected")
+                
+                # Also update server instructions if available
+                if "server_info" in connection_result and connection_result["server_info"]:
+                    server_info = connection_result["server_info"]
+                    if isinstance(server_info, dict):
+                        response_text += f"  Server: {server_info.get('server_name', 'Unknown')} "
+                        response_text += f"v{server_info.get('version', 'Unknown')}\n"
+                        
+                        # Store instructions if available
+                        if "instructions" in server_info:
+                            server_state.instructions = server_info["instructions"]
+                            logger.info(f"Received and stored server instructions ({len(server_info['instructions'])} chars)")
             else:
                 response_text += f"✗ Failed to connect to game server\n"
                 response_text += f"  Attempts: {connection_result['attempts']}\n"
@@ -483,7 +482,6 @@ async def handle_s1_launch_game(arguments: Dict[str, Any], tcp_client: TcpClient
                 response_text += "  - Check MelonLoader logs for errors\n"
                 response_text += "  - Verify the mod is installed correctly\n"
         
-        import json
         return [TextContent(type="text", text=response_text)]
         
     except Exception as e:
@@ -491,8 +489,9 @@ async def handle_s1_launch_game(arguments: Dict[str, Any], tcp_client: TcpClient
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_close_game(arguments: Dict[str, Any], tcp_client: TcpClient, config: Config) -> list[TextContent]:
+async def handle_s1_close_game(arguments: Dict[str, Any], config: Config) -> list[TextContent]:
     """Handle s1_close_game tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
         # Check if game is running
         if not _is_game_running():
@@ -531,15 +530,9 @@ async def handle_s1_close_game(arguments: Dict[str, Any], tcp_client: TcpClient,
             
             # Final verification
             if not _is_game_running():
-                # Update global connection state
-                try:
-                    import sys
-                    main_module = sys.modules.get('__main__') or sys.modules.get('s1mcpclient.src.main')
-                    if main_module and hasattr(main_module, 'is_connected'):
-                        main_module.is_connected = False
-                        logger.info("Updated global connection state to disconnected")
-                except Exception as e:
-                    logger.warning(f"Could not update global connection state: {e}")
+                # Update shared connection state
+                server_state.connected = False
+                logger.info("Updated global connection state to disconnected")
                 
                 return [TextContent(
                     type="text",
@@ -566,13 +559,12 @@ async def handle_s1_close_game(arguments: Dict[str, Any], tcp_client: TcpClient,
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_get_game_process_info(arguments: Dict[str, Any], tcp_client: TcpClient, config: Config) -> list[TextContent]:
+async def handle_s1_get_game_process_info(arguments: Dict[str, Any], config: Config) -> list[TextContent]:
     """Handle s1_get_game_process_info tool call."""
     try:
         process_info = _get_game_process_info()
         
-        import json
-        return [TextContent(type="text", text=json.dumps(process_info, indent=2))]
+        return [TextContent(type="text", text=format_result(process_info))]
         
     except Exception as e:
         logger.error(f"Error in s1_get_game_process_info: {e}", exc_info=True)
@@ -3,40 +3,45 @@
 from typing import Any, Dict
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 
 
 logger = get_logger()
 
 
-def get_game_state_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_game_state_tools() -> tuple[Tool, ...]:
     """
     Get all Game State MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_get_game_state",
-            description="Get current game state information including scene, game time, network status, game version, and loaded mods",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_get_game_state",
+                description="Get current game state information including scene, game time, network status, game version, and loaded mods",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_get_game_state(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_game_state(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_game_state tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
-        response = tcp_client.call_with_retry("get_game_state", {})
+        response = await tcp_client.call_batched("get_game_state", {})
         
         if response.error:
             return [TextContent(
@@ -44,8 +49,7 @@ async def handle_s1_get_game_state(arguments: Dict[str, Any], tcp_client: TcpCli
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_game_state: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -56,3 +60,6 @@ TOOL_HANDLERS = {
     "s1_get_game_state": handle_s1_get_game_state,
 }
 
+READ_ONLY_TOOLS = {
+    "s1_get_game_state",
+}
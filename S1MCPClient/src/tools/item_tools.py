@@ -1,95 +1,101 @@
 """Item-related MCP tools."""
 
+import asyncio
 from typing import Any, Dict, Optional
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 
 
 logger = get_logger()
 
 
-def get_item_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_item_tools() -> tuple[Tool, ...]:
     """
     Get all Item-related MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_list_items",
-            description="List all item definitions in the game, optionally filtered by category",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "category": {
-                        "type": "string",
-                        "description": "Optional category filter"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_get_item",
-            description="Get detailed information about an item definition by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the item"
-                    }
-                },
-                "required": ["item_id"]
-            }
-        ),
-        Tool(
-            name="s1_spawn_item",
-            description="Spawn an item in the world at a specific position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the item"
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_list_items",
+                description="List all item definitions in the game, optionally filtered by category",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "category": {
+                            "type": "string",
+                            "description": "Optional category filter"
+                        }
                     },
-                    "position": {
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "number", "description": "X coordinate"},
-                            "y": {"type": "number", "description": "Y coordinate"},
-                            "z": {"type": "number", "description": "Z coordinate"}
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_get_item",
+                description="Get detailed information about an item definition by ID",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "item_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the item"
+                        }
+                    },
+                    "required": ["item_id"]
+                }
+            ),
+            Tool(
+                name="s1_spawn_item",
+                description="Spawn an item in the world at a specific position",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "item_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the item"
+                        },
+                        "position": {
+                            "type": "object",
+                            "properties": {
+                                "x": {"type": "number", "description": "X coordinate"},
+                                "y": {"type": "number", "description": "Y coordinate"},
+                                "z": {"type": "number", "description": "Z coordinate"}
+                            },
+                            "required": ["x", "y", "z"],
+                            "description": "Spawn position coordinates"
                         },
-                        "required": ["x", "y", "z"],
-                        "description": "Spawn position coordinates"
+                        "quantity": {
+                            "type": "number",
+                            "description": "Number of items to spawn (default: 1)",
+                            "default": 1
+                        }
                     },
-                    "quantity": {
-                        "type": "number",
-                        "description": "Number of items to spawn (default: 1)",
-                        "default": 1
-                    }
-                },
-                "required": ["item_id", "position"]
-            }
+                    "required": ["item_id", "position"]
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_list_items(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_list_items(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_list_items tool call."""
+    tcp_client = tcp_client_ctx.get()
     category = arguments.get("category")
     params = {}
     if category:
         params["category"] = category
     
     try:
-        response = tcp_client.call_with_retry("list_items", params if params else None)
+        response = await tcp_client.call_batched("list_items", params if params else None)
         
         if response.error:
             return [TextContent(
@@ -97,21 +103,21 @@ async def handle_s1_list_items(arguments: Dict[str, Any], tcp_client: TcpClient)
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_list_items: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_get_item(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_item(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_item tool call."""
+    tcp_client = tcp_client_ctx.get()
     item_id = arguments.get("item_id")
     if not item_id:
         return [TextContent(type="text", text="Error: item_id is required")]
     
     try:
-        response = tcp_client.call_with_retry("get_item", {"item_id": item_id})
+        response = await tcp_client.call_batched("get_item", {"item_id": item_id})
         
         if response.error:
             return [TextContent(
@@ -119,15 +125,15 @@ async def handle_s1_get_item(arguments: Dict[str, Any], tcp_client: TcpClient) -
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_item: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_spawn_item(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_spawn_item(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_spawn_item tool call."""
+    tcp_client = tcp_client_ctx.get()
     item_id = arguments.get("item_id")
     position = arguments.get("position")
     quantity = arguments.get("quantity", 1)
@@ -145,7 +151,7 @@ async def handle_s1_spawn_item(arguments: Dict[str, Any], tcp_client: TcpClient)
         if quantity != 1:
             params["quantity"] = quantity
         
-        response = tcp_client.call_with_retry("spawn_item", params)
+        response = await asyncio.to_thread(tcp_client.call_with_retry, "spawn_item", params)
         
         if response.error:
             return [TextContent(
@@ -153,8 +159,7 @@ async def handle_s1_spawn_item(arguments: Dict[str, Any], tcp_client: TcpClient)
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_spawn_item: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -167,3 +172,7 @@ TOOL_HANDLERS = {
     "s1_spawn_item": handle_s1_spawn_item,
 }
 
+READ_ONLY_TOOLS = {
+    "s1_list_items",
+    "s1_get_item",
+}
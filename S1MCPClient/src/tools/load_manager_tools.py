@@ -1,61 +1,67 @@
 """LoadManager MCP tools for save game management."""
 
+import asyncio
 from typing import Any, Dict
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 
 
 logger = get_logger()
 
 
-def get_load_manager_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_load_manager_tools() -> tuple[Tool, ...]:
     """
     Get all LoadManager MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_list_saves",
-            description="List all available save games with their properties. Returns an array of save game objects with all available metadata.",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_load_save",
-            description=(
-                "Load a specific save game by slot index. If a save is already loaded (not in menu scene), "
-                "this will automatically return to the menu first before loading the requested save. "
-                "Note: Slot indices are 0-based (use 0 for first save, 1 for second, etc.)."
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_list_saves",
+                description="List all available save games with their properties. Returns an array of save game objects with all available metadata.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_load_save",
+                description=(
+                    "Load a specific save game by slot index. If a save is already loaded (not in menu scene), "
+                    "this will automatically return to the menu first before loading the requested save. "
+                    "Note: Slot indices are 0-based (use 0 for first save, 1 for second, etc.)."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "slot_index": {
+                            "type": "integer",
+                            "description": "The 0-based index of the save slot to load",
+                            "minimum": 0
+                        }
+                    },
+                    "required": ["slot_index"]
+                }
             ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "slot_index": {
-                        "type": "integer",
-                        "description": "The 0-based index of the save slot to load",
-                        "minimum": 0
-                    }
-                },
-                "required": ["slot_index"]
-            }
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_list_saves(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_list_saves(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_list_saves tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
-        response = tcp_client.call_with_retry("list_saves", {})
+        response = await tcp_client.call_batched("list_saves", {})
         
         if response.error:
             return [TextContent(
@@ -63,8 +69,7 @@ async def handle_s1_list_saves(arguments: Dict[str, Any], tcp_client: TcpClient)
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        result_text = json.dumps(response.result, indent=2)
+        result_text = format_result(response.result)
         
         # Add helpful summary
         if isinstance(response.result, dict) and "saves" in response.result:
@@ -78,8 +83,9 @@ async def handle_s1_list_saves(arguments: Dict[str, Any], tcp_client: TcpClient)
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_load_save(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_load_save(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_load_save tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
         slot_index = arguments.get("slot_index")
         
@@ -89,7 +95,7 @@ async def handle_s1_load_save(arguments: Dict[str, Any], tcp_client: TcpClient)
                 text="Error: slot_index parameter is required"
             )]
         
-        response = tcp_client.call_with_retry("load_save", {"slot_index": slot_index})
+        response = await asyncio.to_thread(tcp_client.call_with_retry, "load_save", {"slot_index": slot_index})
         
         if response.error:
             return [TextContent(
@@ -109,8 +115,7 @@ async def handle_s1_load_save(arguments: Dict[str, Any], tcp_client: TcpClient)
             
             return [TextContent(type="text", text=status_text)]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_load_save: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -122,3 +127,6 @@ TOOL_HANDLERS = {
     "s1_load_save": handle_s1_load_save,
 }
 
+READ_ONLY_TOOLS = {
+    "s1_list_saves",
+}
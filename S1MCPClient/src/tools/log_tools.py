@@ -1,76 +1,81 @@
 """Log capture MCP tools."""
 
+import asyncio
 from typing import Any, Dict
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
 
 
 logger = get_logger()
 
 
-def get_log_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_log_tools() -> tuple[Tool, ...]:
     """
     Get all Log Capture MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_capture_logs",
-            description=(
-                "Capture and filter game logs from MelonLoader for debugging. "
-                "Retrieves logs from the game's Latest.log file with optional filtering by keywords, "
-                "timestamps, regex patterns, and line count limits. Useful for agentic debugging to "
-                "diagnose issues, track errors, and understand game behavior."
-            ),
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "last_n_lines": {
-                        "type": "integer",
-                        "description": "Get the last N lines from the log file. Cannot be used with first_n_lines.",
-                        "minimum": 1
-                    },
-                    "first_n_lines": {
-                        "type": "integer",
-                        "description": "Get the first N lines from the log file. Cannot be used with last_n_lines.",
-                        "minimum": 1
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_capture_logs",
+                description=(
+                    "Capture and filter game logs from MelonLoader for debugging. "
+                    "Retrieves logs from the game's Latest.log file with optional filtering by keywords, "
+                    "timestamps, regex patterns, and line count limits. Useful for agentic debugging to "
+                    "diagnose issues, track errors, and understand game behavior."
+                ),
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "last_n_lines": {
+                            "type": "integer",
+                            "description": "Get the last N lines from the log file. Cannot be used with first_n_lines.",
+                            "minimum": 1
+                        },
+                        "first_n_lines": {
+                            "type": "integer",
+                            "description": "Get the first N lines from the log file. Cannot be used with last_n_lines.",
+                            "minimum": 1
+                        },
+                        "keyword": {
+                            "type": "string",
+                            "description": "Filter logs by keyword (case-insensitive search). Returns only lines containing this keyword."
+                        },
+                        "from_timestamp": {
+                            "type": "string",
+                            "description": "Filter logs from this timestamp onwards. Format: HH:mm:ss or HH:mm:ss.fff (e.g., '12:30:45' or '12:30:45.123')"
+                        },
+                        "to_timestamp": {
+                            "type": "string",
+                            "description": "Filter logs up to this timestamp. Format: HH:mm:ss or HH:mm:ss.fff (e.g., '12:35:00' or '12:35:00.999')"
+                        },
+                        "include_pattern": {
+                            "type": "string",
+                            "description": "Regex pattern to include matching lines (case-insensitive). Only lines matching this pattern will be returned."
+                        },
+                        "exclude_pattern": {
+                            "type": "string",
+                            "description": "Regex pattern to exclude matching lines (case-insensitive). Lines matching this pattern will be filtered out."
+                        }
                     },
-                    "keyword": {
-                        "type": "string",
-                        "description": "Filter logs by keyword (case-insensitive search). Returns only lines containing this keyword."
-                    },
-                    "from_timestamp": {
-                        "type": "string",
-                        "description": "Filter logs from this timestamp onwards. Format: HH:mm:ss or HH:mm:ss.fff (e.g., '12:30:45' or '12:30:45.123')"
-                    },
-                    "to_timestamp": {
-                        "type": "string",
-                        "description": "Filter logs up to this timestamp. Format: HH:mm:ss or HH:mm:ss.fff (e.g., '12:35:00' or '12:35:00.999')"
-                    },
-                    "include_pattern": {
-                        "type": "string",
-                        "description": "Regex pattern to include matching lines (case-insensitive). Only lines matching this pattern will be returned."
-                    },
-                    "exclude_pattern": {
-                        "type": "string",
-                        "description": "Regex pattern to exclude matching lines (case-insensitive). Lines matching this pattern will be filtered out."
-                    }
-                },
-                "required": []
-            }
+                    "required": []
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_capture_logs(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_capture_logs(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_capture_logs tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
         # Build parameters from arguments
         params = {}
@@ -98,7 +103,7 @@ async def handle_s1_capture_logs(arguments: Dict[str, Any], tcp_client: TcpClien
         
         logger.debug(f"Capturing logs with params: {params}")
         
-        response = tcp_client.call_with_retry("capture_logs", params)
+        response = await asyncio.to_thread(tcp_client.call_with_retry, "capture_logs", params)
         
         if response.error:
             return [TextContent(
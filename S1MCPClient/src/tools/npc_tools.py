@@ -1,122 +1,128 @@
 """NPC-related MCP tools."""
 
+import asyncio
 from typing import Any, Dict, Optional
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 
 
 logger = get_logger()
 
 
-def get_npc_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_npc_tools() -> tuple[Tool, ...]:
     """
     Get all NPC-related MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_get_npc",
-            description="Get detailed information about a specific NPC by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "npc_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the NPC"
-                    }
-                },
-                "required": ["npc_id"]
-            }
-        ),
-        Tool(
-            name="s1_list_npcs",
-            description="List all NPCs in the game, optionally filtered by state",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "filter": {
-                        "type": "string",
-                        "enum": ["conscious", "unconscious", "in_building", "in_vehicle"],
-                        "description": "Optional filter to apply to the list"
-                    }
-                },
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_get_npc_position",
-            description="Get the current position of an NPC",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "npc_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the NPC"
-                    }
-                },
-                "required": ["npc_id"]
-            }
-        ),
-        Tool(
-            name="s1_teleport_npc",
-            description="Teleport an NPC to a specific position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "npc_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the NPC"
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_get_npc",
+                description="Get detailed information about a specific NPC by ID",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "npc_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the NPC"
+                        }
+                    },
+                    "required": ["npc_id"]
+                }
+            ),
+            Tool(
+                name="s1_list_npcs",
+                description="List all NPCs in the game, optionally filtered by state",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "filter": {
+                            "type": "string",
+                            "enum": ["conscious", "unconscious", "in_building", "in_vehicle"],
+                            "description": "Optional filter to apply to the list"
+                        }
                     },
-                    "position": {
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "number", "description": "X coordinate"},
-                            "y": {"type": "number", "description": "Y coordinate"},
-                            "z": {"type": "number", "description": "Z coordinate"}
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_get_npc_position",
+                description="Get the current position of an NPC",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "npc_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the NPC"
+                        }
+                    },
+                    "required": ["npc_id"]
+                }
+            ),
+            Tool(
+                name="s1_teleport_npc",
+                description="Teleport an NPC to a specific position",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "npc_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the NPC"
+                        },
+                        "position": {
+                            "type": "object",
+                            "properties": {
+                                "x": {"type": "number", "description": "X coordinate"},
+                                "y": {"type": "number", "description": "Y coordinate"},
+                                "z": {"type": "number", "description": "Z coordinate"}
+                            },
+                            "required": ["x", "y", "z"],
+                            "description": "Target position coordinates"
+                        }
+                    },
+                    "required": ["npc_id", "position"]
+                }
+            ),
+            Tool(
+                name="s1_set_npc_health",
+                description="Modify an NPC's health value",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "npc_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the NPC"
                         },
-                        "required": ["x", "y", "z"],
-                        "description": "Target position coordinates"
-                    }
-                },
-                "required": ["npc_id", "position"]
-            }
-        ),
-        Tool(
-            name="s1_set_npc_health",
-            description="Modify an NPC's health value",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "npc_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the NPC"
+                        "health": {
+                            "type": "number",
+                            "description": "New health value"
+                        }
                     },
-                    "health": {
-                        "type": "number",
-                        "description": "New health value"
-                    }
-                },
-                "required": ["npc_id", "health"]
-            }
+                    "required": ["npc_id", "health"]
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_get_npc(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_npc(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_npc tool call."""
+    tcp_client = tcp_client_ctx.get()
     npc_id = arguments.get("npc_id")
     if not npc_id:
         return [TextContent(type="text", text="Error: npc_id is required")]
     
     try:
-        response = tcp_client.call_with_retry("get_npc", {"npc_id": npc_id})
+        response = await tcp_client.call_batched("get_npc", {"npc_id": npc_id})
         
         if response.error:
             return [TextContent(
@@ -124,22 +130,22 @@ async def handle_s1_get_npc(arguments: Dict[str, Any], tcp_client: TcpClient) ->
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_npc: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_list_npcs(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_list_npcs(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_list_npcs tool call."""
+    tcp_client = tcp_client_ctx.get()
     filter_value = arguments.get("filter")
     params = {}
     if filter_value:
         params["filter"] = filter_value
     
     try:
-        response = tcp_client.call_with_retry("list_npcs", params if params else None)
+        response = await tcp_client.call_batched("list_npcs", params if params else None)
         
         if response.error:
             return [TextContent(
@@ -147,21 +153,21 @@ async def handle_s1_list_npcs(arguments: Dict[str, Any], tcp_client: TcpClient)
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_list_npcs: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_get_npc_position(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_npc_position(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_npc_position tool call."""
+    tcp_client = tcp_client_ctx.get()
     npc_id = arguments.get("npc_id")
     if not npc_id:
         return [TextContent(type="text", text="Error: npc_id is required")]
     
     try:
-        response = tcp_client.call_with_retry("get_npc_position", {"npc_id": npc_id})
+        response = await tcp_client.call_batched("get_npc_position", {"npc_id": npc_id})
         
         if response.error:
             return [TextContent(
@@ -169,15 +175,15 @@ async def handle_s1_get_npc_position(arguments: Dict[str, Any], tcp_client: TcpC
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_npc_position: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_teleport_npc(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_teleport_npc(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_teleport_npc tool call."""
+    tcp_client = tcp_client_ctx.get()
     npc_id = arguments.get("npc_id")
     position = arguments.get("position")
     
@@ -187,7 +193,7 @@ async def handle_s1_teleport_npc(arguments: Dict[str, Any], tcp_client: TcpClien
         return [TextContent(type="text", text="Error: position is required")]
     
     try:
-        response = tcp_client.call_with_retry("teleport_npc", {
+        response = await asyncio.to_thread(tcp_client.call_with_retry, "teleport_npc", {
             "npc_id": npc_id,
             "position": position
         })
@@ -198,15 +204,15 @@ async def handle_s1_teleport_npc(arguments: Dict[str, Any], tcp_client: TcpClien
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_teleport_npc: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_set_npc_health(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_set_npc_health(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_set_npc_health tool call."""
+    tcp_client = tcp_client_ctx.get()
     npc_id = arguments.get("npc_id")
     health = arguments.get("health")
     
@@ -216,7 +222,7 @@ async def handle_s1_set_npc_health(arguments: Dict[str, Any], tcp_client: TcpCli
         return [TextContent(type="text", text="Error: health is required")]
     
     try:
-        response = tcp_client.call_with_retry("set_npc_health", {
+        response = await asyncio.to_thread(tcp_client.call_with_retry, "set_npc_health", {
             "npc_id": npc_id,
             "health": health
         })
@@ -227,8 +233,7 @@ async def handle_s1_set_npc_health(arguments: Dict[str, Any], tcp_client: TcpCli
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_set_npc_health: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -243,3 +248,8 @@ TOOL_HANDLERS = {
     "s1_set_npc_health": handle_s1_set_npc_health,
 }
 
+READ_ONLY_TOOLS = {
+    "s1_get_npc",
+    "s1_list_npcs",
+    "s1_get_npc_position",
+}
@@ -1,90 +1,96 @@
 """Player-related MCP tools."""
 
+import asyncio
 from typing import Any, Dict
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 
 
 logger = get_logger()
 
 
-def get_player_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_player_tools() -> tuple[Tool, ...]:
     """
     Get all Player-related MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_get_player",
-            description="Get current player information including position, health, money, and network status",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_get_player_inventory",
-            description="Get the player's inventory items",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_teleport_player",
-            description="Teleport the player to a specific position",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "position": {
-                        "type": "object",
-                        "properties": {
-                            "x": {"type": "number", "description": "X coordinate"},
-                            "y": {"type": "number", "description": "Y coordinate"},
-                            "z": {"type": "number", "description": "Z coordinate"}
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_get_player",
+                description="Get current player information including position, health, money, and network status",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_get_player_inventory",
+                description="Get the player's inventory items",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_teleport_player",
+                description="Teleport the player to a specific position",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "position": {
+                            "type": "object",
+                            "properties": {
+                                "x": {"type": "number", "description": "X coordinate"},
+                                "y": {"type": "number", "description": "Y coordinate"},
+                                "z": {"type": "number", "description": "Z coordinate"}
+                            },
+                            "required": ["x", "y", "z"],
+                            "description": "Target position coordinates"
+                        }
+                    },
+                    "required": ["position"]
+                }
+            ),
+            Tool(
+                name="s1_add_item_to_player",
+                description="Add item(s) to the player's inventory",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "item_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the item"
                         },
-                        "required": ["x", "y", "z"],
-                        "description": "Target position coordinates"
-                    }
-                },
-                "required": ["position"]
-            }
-        ),
-        Tool(
-            name="s1_add_item_to_player",
-            description="Add item(s) to the player's inventory",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "item_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the item"
+                        "quantity": {
+                            "type": "number",
+                            "description": "Number of items to add (default: 1)",
+                            "default": 1
+                        }
                     },
-                    "quantity": {
-                        "type": "number",
-                        "description": "Number of items to add (default: 1)",
-                        "default": 1
-                    }
-                },
-                "required": ["item_id"]
-            }
+                    "required": ["item_id"]
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_get_player(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_player(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_player tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
-        response = tcp_client.call_with_retry("get_player", {})
+        response = await tcp_client.call_batched("get_player", {})
         
         if response.error:
             return [TextContent(
@@ -92,17 +98,17 @@ async def handle_s1_get_player(arguments: Dict[str, Any], tcp_client: TcpClient)
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_player: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_get_player_inventory(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_player_inventory(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_player_inventory tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
-        response = tcp_client.call_with_retry("get_player_inventory", {})
+        response = await tcp_client.call_batched("get_player_inventory", {})
         
         if response.error:
             return [TextContent(
@@ -110,22 +116,22 @@ async def handle_s1_get_player_inventory(arguments: Dict[str, Any], tcp_client:
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_player_inventory: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_teleport_player(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_teleport_player(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_teleport_player tool call."""
+    tcp_client = tcp_client_ctx.get()
     position = arguments.get("position")
     
     if not position:
         return [TextContent(type="text", text="Error: position is required")]
     
     try:
-        response = tcp_client.call_with_retry("teleport_player", {"position": position})
+        response = await asyncio.to_thread(tcp_client.call_with_retry, "teleport_player", {"position": position})
         
         if response.error:
             return [TextContent(
@@ -133,15 +139,15 @@ async def handle_s1_teleport_player(arguments: Dict[str, Any], tcp_client: TcpCl
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_teleport_player: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_add_item_to_player(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_add_item_to_player(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_add_item_to_player tool call."""
+    tcp_client = tcp_client_ctx.get()
     item_id = arguments.get("item_id")
     quantity = arguments.get("quantity", 1)
     
@@ -149,7 +155,7 @@ async def handle_s1_add_item_to_player(arguments: Dict[str, Any], tcp_client: Tc
         return [TextContent(type="text", text="Error: item_id is required")]
     
     try:
-        response = tcp_client.call_with_retry("add_item_to_player", {
+        response = await asyncio.to_thread(tcp_client.call_with_retry, "add_item_to_player", {
             "item_id": item_id,
             "quantity": quantity
         })
@@ -160,8 +166,7 @@ async def handle_s1_add_item_to_player(arguments: Dict[str, Any], tcp_client: Tc
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_add_item_to_player: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -175,3 +180,7 @@ TOOL_HANDLERS = {
     "s1_add_item_to_player": handle_s1_add_item_to_player,
 }
 
+READ_ONLY_TOOLS = {
+    "s1_get_player",
+    "s1_get_player_inventory",
+}
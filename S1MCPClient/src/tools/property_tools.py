@@ -3,58 +3,63 @@
 from typing import Any, Dict
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 
 
 logger = get_logger()
 
 
-def get_property_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_property_tools() -> tuple[Tool, ...]:
     """
     Get all Property-related MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_list_properties",
-            description="List all properties in the game",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_get_property",
-            description="Get detailed information about a property by ID or name",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "property_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the property"
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_list_properties",
+                description="List all properties in the game",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_get_property",
+                description="Get detailed information about a property by ID or name",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "property_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the property"
+                        },
+                        "property_name": {
+                            "type": "string",
+                            "description": "The name of the property (alternative to property_id)"
+                        }
                     },
-                    "property_name": {
-                        "type": "string",
-                        "description": "The name of the property (alternative to property_id)"
-                    }
-                },
-                "required": []
-            }
+                    "required": []
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_list_properties(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_list_properties(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_list_properties tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
-        response = tcp_client.call_with_retry("list_properties", {})
+        response = await tcp_client.call_batched("list_properties", {})
         
         if response.error:
             return [TextContent(
@@ -62,15 +67,15 @@ async def handle_s1_list_properties(arguments: Dict[str, Any], tcp_client: TcpCl
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_list_properties: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_get_property(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_property(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_property tool call."""
+    tcp_client = tcp_client_ctx.get()
     property_id = arguments.get("property_id")
     property_name = arguments.get("property_name")
     
@@ -84,7 +89,7 @@ async def handle_s1_get_property(arguments: Dict[str, Any], tcp_client: TcpClien
         if property_name:
             params["property_name"] = property_name
         
-        response = tcp_client.call_with_retry("get_property", params)
+        response = await tcp_client.call_batched("get_property", params)
         
         if response.error:
             return [TextContent(
@@ -92,8 +97,7 @@ async def handle_s1_get_property(arguments: Dict[str, Any], tcp_client: TcpClien
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_property: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -105,3 +109,7 @@ TOOL_HANDLERS = {
     "s1_get_property": handle_s1_get_property,
 }
 
+READ_ONLY_TOOLS = {
+    "s1_list_properties",
+    "s1_get_property",
+}
@@ -5,7 +5,6 @@ from urllib.parse import quote_plus
 from mcp.types import Tool, TextContent
 import httpx
 
-from ..tcp_client import TcpClient
 from ..utils.logger import get_logger
 
 
@@ -15,46 +14,48 @@ logger = get_logger()
 CONTEXT7_BASE_URL = "https://context7.com/ifbars/s1api/llms.txt"
 
 
-def get_s1api_docs_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_s1api_docs_tools() -> tuple[Tool, ...]:
     """
     Get all S1API documentation search MCP tools.
     
-    Args:
-        tcp_client: TCP client instance (unused, kept for consistency)
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_search_s1api_docs",
-            description="Search S1API documentation using Context7's llms.txt endpoint. Retrieves relevant documentation snippets for a given topic.",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "topic": {
-                        "type": "string",
-                        "description": "Search topic/keyword (e.g., 'Phone App Creation', 'NPC Creation', 'Quest System')"
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_search_s1api_docs",
+                description="Search S1API documentation using Context7's llms.txt endpoint. Retrieves relevant documentation snippets for a given topic.",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "topic": {
+                            "type": "string",
+                            "description": "Search topic/keyword (e.g., 'Phone App Creation', 'NPC Creation', 'Quest System')"
+                        },
+                        "tokens": {
+                            "type": "integer",
+                            "description": "Maximum tokens to retrieve (default: 5000)",
+                            "default": 5000
+                        }
                     },
-                    "tokens": {
-                        "type": "integer",
-                        "description": "Maximum tokens to retrieve (default: 5000)",
-                        "default": 5000
-                    }
-                },
-                "required": ["topic"]
-            }
+                    "required": ["topic"]
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_search_s1api_docs(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_search_s1api_docs(arguments: Dict[str, Any]) -> list[TextContent]:
     """
     Handle s1_search_s1api_docs tool call.
     
     Args:
         arguments: Tool arguments containing 'topic' and optionally 'tokens'
-        tcp_client: TCP client instance (unused, kept for consistency)
     
     Returns:
         List of TextContent with documentation results
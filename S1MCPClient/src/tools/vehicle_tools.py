@@ -3,54 +3,59 @@
 from typing import Any, Dict
 from mcp.types import Tool, TextContent
 
-from ..tcp_client import TcpClient
+from ..tcp_client import tcp_client_ctx
 from ..utils.logger import get_logger
+from ..utils.result_format import format_result
 
 
 logger = get_logger()
 
 
-def get_vehicle_tools(tcp_client: TcpClient) -> list[Tool]:
+_TOOLS_CACHE: tuple[Tool, ...] | None = None
+
+
+def get_vehicle_tools() -> tuple[Tool, ...]:
     """
     Get all Vehicle-related MCP tools.
     
-    Args:
-        tcp_client: TCP client instance
-    
     Returns:
-        List of MCP Tool definitions
+        Tuple of MCP Tool definitions
     """
-    return [
-        Tool(
-            name="s1_list_vehicles",
-            description="List all vehicles in the game",
-            inputSchema={
-                "type": "object",
-                "properties": {},
-                "required": []
-            }
-        ),
-        Tool(
-            name="s1_get_vehicle",
-            description="Get detailed information about a vehicle by ID",
-            inputSchema={
-                "type": "object",
-                "properties": {
-                    "vehicle_id": {
-                        "type": "string",
-                        "description": "The unique identifier of the vehicle"
-                    }
-                },
-                "required": ["vehicle_id"]
-            }
+    global _TOOLS_CACHE
+    if _TOOLS_CACHE is None:
+        _TOOLS_CACHE = (
+            Tool(
+                name="s1_list_vehicles",
+                description="List all vehicles in the game",
+                inputSchema={
+                    "type": "object",
+                    "properties": {},
+                    "required": []
+                }
+            ),
+            Tool(
+                name="s1_get_vehicle",
+                description="Get detailed information about a vehicle by ID",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "vehicle_id": {
+                            "type": "string",
+                            "description": "The unique identifier of the vehicle"
+                        }
+                    },
+                    "required": ["vehicle_id"]
+                }
+            ),
         )
-    ]
+    return _TOOLS_CACHE
 
 
-async def handle_s1_list_vehicles(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_list_vehicles(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_list_vehicles tool call."""
+    tcp_client = tcp_client_ctx.get()
     try:
-        response = tcp_client.call_with_retry("list_vehicles", {})
+        response = await tcp_client.call_batched("list_vehicles", {})
         
         if response.error:
             return [TextContent(
@@ -58,21 +63,21 @@ async def handle_s1_list_vehicles(arguments: Dict[str, Any], tcp_client: TcpClie
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_list_vehicles: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
 
 
-async def handle_s1_get_vehicle(arguments: Dict[str, Any], tcp_client: TcpClient) -> list[TextContent]:
+async def handle_s1_get_vehicle(arguments: Dict[str, Any]) -> list[TextContent]:
     """Handle s1_get_vehicle tool call."""
+    tcp_client = tcp_client_ctx.get()
     vehicle_id = arguments.get("vehicle_id")
     if not vehicle_id:
         return [TextContent(type="text", text="Error: vehicle_id is required")]
     
     try:
-        response = tcp_client.call_with_retry("get_vehicle", {"vehicle_id": vehicle_id})
+        response = await tcp_client.call_batched("get_vehicle", {"vehicle_id": vehicle_id})
         
         if response.error:
             return [TextContent(
@@ -80,8 +85,7 @@ async def handle_s1_get_vehicle(arguments: Dict[str, Any], tcp_client: TcpClient
                 text=f"Error: {response.error.message} (code: {response.error.code})"
             )]
         
-        import json
-        return [TextContent(type="text", text=json.dumps(response.result, indent=2))]
+        return [TextContent(type="text", text=format_result(response.result))]
     except Exception as e:
         logger.error(f"Error in s1_get_vehicle: {e}")
         return [TextContent(type="text", text=f"Error: {str(e)}")]
@@ -93,3 +97,7 @@ TOOL_HANDLERS = {
     "s1_get_vehicle": handle_s1_get_vehicle,
 }
 
+READ_ONLY_TOOLS = {
+    "s1_list_vehicles",
+    "s1_get_vehicle",
+}
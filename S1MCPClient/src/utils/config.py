@@ -20,7 +20,10 @@ class Config:
         game_mono_path: Optional[str] = None,
         game_executable: str = "Schedule I.exe",
         game_startup_timeout: float = 60.0,
-        game_connection_poll_interval: float = 2.0
+        game_connection_poll_interval: float = 2.0,
+        tool_cache_ttl: float = 1.0,
+        batch_window_ms: float = 5.0,
+        profile_report_interval: int = 0
     ):
         """
         Initialize configuration.
@@ -36,6 +39,9 @@ class Config:
             game_executable: Game executable name
             game_startup_timeout: Timeout for game startup in seconds
             game_connection_poll_interval: Interval for connection polling in seconds
+            tool_cache_ttl: Seconds to reuse results of read-only tool calls (0 disables)
+            batch_window_ms: Milliseconds to wait for concurrent read-only calls to share a batch (0 disables)
+            profile_report_interval: Log tool call latency percentiles every N calls (0 disables)
         """
         self.host = host
         self.port = port
@@ -47,6 +53,9 @@ class Config:
         self.game_executable = game_executable
         self.game_startup_timeout = game_startup_timeout
         self.game_connection_poll_interval = game_connection_poll_interval
+        self.tool_cache_ttl = tool_cache_ttl
+        self.batch_window_ms = batch_window_ms
+        self.profile_report_interval = profile_report_interval
     
     @classmethod
     def from_file(cls, config_path: Optional[str] = None) -> "Config":
@@ -66,10 +75,6 @@ class Config:
         else:
             config_path = Path(config_path)
         
-        if not config_path.exists():
-            # Return default config if file doesn't exist
-            return cls()
-        
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
                 data = json.load(f)
@@ -84,8 +89,14 @@ class Config:
                 game_mono_path=data.get("game_mono_path"),
                 game_executable=data.get("game_executable", "Schedule I.exe"),
                 game_startup_timeout=float(data.get("game_startup_timeout", 60.0)),
-                game_connection_poll_interval=float(data.get("game_connection_poll_interval", 2.0))
+                game_connection_poll_interval=float(data.get("game_connection_poll_interval", 2.0)),
+                tool_cache_ttl=float(data.get("tool_cache_ttl", 1.0)),
+                batch_window_ms=float(data.get("batch_window_ms", 5.0)),
+                profile_report_interval=int(data.get("profile_report_interval", 0))
             )
+        except FileNotFoundError:
+            # Return default config if file doesn't exist
+            return cls()
         except (json.JSONDecodeError, KeyError, ValueError) as e:
             # Return default config on error
             import logging
@@ -105,7 +116,10 @@ class Config:
             "game_mono_path": self.game_mono_path,
             "game_executable": self.game_executable,
             "game_startup_timeout": self.game_startup_timeout,
-            "game_connection_poll_interval": self.game_connection_poll_interval
+            "game_connection_poll_interval": self.game_connection_poll_interval,
+            "tool_cache_ttl": self.tool_cache_ttl,
+            "batch_window_ms": self.batch_window_ms,
+            "profile_report_interval": self.profile_report_interval
         }
     
     def save(self, config_path: Optional[str] = None) -> None:
@@ -0,0 +1,80 @@
+"""Lightweight latency profiling for tool calls."""
+
+import time
+from collections import defaultdict
+from typing import Dict, List
+
+from .logger import get_logger
+
+
+PERCENTILES = (50, 90, 95, 99)
+
+
+class McpProfiler:
+    """
+    Record per-tool, per-stage latencies and periodically log percentile summaries.
+
+    Samples are stored as raw nanosecond integers so recording stays cheap;
+    formatting only happens when a report is logged. Each report covers the
+    calls since the previous one.
+    """
+
+    def __init__(self, report_every: int = 100):
+        """
+        Initialize the profiler.
+
+        Args:
+            report_every: Number of recorded calls between summary reports
+        """
+        self.report_every = report_every
+        self.logger = get_logger()
+        self._samples: Dict[tuple[str, str], List[int]] = defaultdict(list)
+        self._calls = 0
+
+    @staticmethod
+    def now() -> int:
+        """Current timestamp in nanoseconds, for passing to record()."""
+        return time.perf_counter_ns()
+
+    def record(self, tool: str, stage: str, started_ns: int, ended_ns: int) -> None:
+        """
+        Record one stage duration.
+
+        Args:
+            tool: Tool name
+            stage: Stage name (e.g. "dispatch", "handler", "total")
+            started_ns: Stage start from now()
+            ended_ns: Stage end from now()
+        """
+        self._samples[(tool, stage)].append(ended_ns - started_ns)
+
+    def call_finished(self) -> None:
+        """Count a finished tool call and log a report every report_every calls."""
+        self._calls += 1
+        if self._calls % self.report_every == 0:
+            self.report()
+
+    def summary(self) -> Dict[tuple[str, str], Dict[str, float]]:
+        """
+        Summarize recorded samples.
+
+        Returns:
+            Mapping of (tool, stage) to sample count and percentile latencies in milliseconds
+        """
+        result = {}
+        for key, samples in self._samples.items():
+            ordered = sorted(samples)
+            stats: Dict[str, float] = {"count": len(ordered)}
+            for pct in PERCENTILES:
+                index = min(len(ordered) - 1, (len(ordered) * pct) // 100)
+                stats[f"p{pct}"] = ordered[index] / 1_000_000
+            result[key] = stats
+        return result
+
+    def report(self) -> None:
+        """Log a percentile summary of the samples since the last report, then drop them."""
+        self.logger.info(f"Tool call latency (ms), {self._calls} calls so far:")
+        for (tool, stage), stats in sorted(self.summary().items()):
+            percentiles = " ".join(f"p{pct}={stats[f'p{pct}']:.2f}" for pct in PERCENTILES)
+            self.logger.info(f"  {tool} [{stage}] n={stats['count']} {percentiles}")
+        self._samples.clear()
@@ -0,0 +1,24 @@
+"""Formatting of mod results returned as tool text."""
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # Optional: results are formatted with the standard library json module
+    orjson = None
+
+
+def format_result(result: Any) -> str:
+    """
+    Format a mod result as compact JSON text for a tool response, using orjson when it is installed.
+    
+    Args:
+        result: JSON-serializable result from the mod
+    
+    Returns:
+        JSON text without indentation or extra whitespace
+    """
+    if orjson is not None:
+        return orjson.dumps(result).decode('utf-8')
+    return json.dumps(result, ensure_ascii=False, separators=(',', ':'))
@@ -0,0 +1,115 @@
+"""Short-lived result cache for read-only tool calls."""
+
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional
+
+
+class ToolCallCacher:
+    """
+    Cache results of read-only tool calls for a short time.
+
+    MCP clients often repeat the same query within a few seconds. Serving those
+    repeats from memory saves a round-trip to the mod. Results that only depend
+    on the game's loaded types (reflection metadata) are kept longer. Any call to
+    a tool that isn't read-only clears the whole cache, since it may have changed
+    game state.
+
+    Reads and writes can run concurrently, so a read that started before a write
+    may finish after it. Each invalidate() starts a new generation; a read records
+    the generation when it starts and its result is only stored if no
+    invalidation happened in the meantime.
+
+    The cache holds at most max_entries results; storing more evicts the least
+    recently used ones, so long read-only sessions don't accumulate every
+    distinct argument set.
+    """
+
+    def __init__(self, ttl: float = 1.0, static_ttl: float = 60.0, max_entries: int = 256):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds a cached result stays valid (0 disables caching)
+            static_ttl: Seconds a result stored with static=True stays valid (never less than ttl)
+            max_entries: Most results kept at once; the least recently used are evicted first
+        """
+        self.ttl = ttl
+        self.static_ttl = max(ttl, static_ttl)
+        self.max_entries = max_entries
+        # Cache key -> (time.monotonic() the entry expires at, result), least recently used first
+        self._entries: OrderedDict[tuple[str, str], tuple[float, list]] = OrderedDict()
+        # Bumped by every invalidate(); results from older generations aren't stored
+        self._generation = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether caching is enabled."""
+        return self.ttl > 0
+
+    @property
+    def generation(self) -> int:
+        """Current cache generation; read it before running a tool and pass it to put()."""
+        return self._generation
+
+    @staticmethod
+    def _make_key(name: str, arguments: Optional[Dict[str, Any]]) -> tuple[str, str]:
+        """Build a cache key from a tool name and its arguments."""
+        return name, json.dumps(arguments or {}, sort_keys=True, default=str)
+
+    def get(self, name: str, arguments: Optional[Dict[str, Any]]) -> Optional[list]:
+        """
+        Get a cached result.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+
+        Returns:
+            Cached tool result, or None if missing or expired
+        """
+        key = self._make_key(name, arguments)
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, result = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return result
+
+    def put(
+        self,
+        name: str,
+        arguments: Optional[Dict[str, Any]],
+        result: list,
+        static: bool = False,
+        generation: Optional[int] = None
+    ) -> None:
+        """
+        Store a tool result.
+
+        Args:
+            name: Tool name
+            arguments: Tool arguments
+            result: Tool result to cache
+            static: Whether the result can't change while the game runs, so it is kept for static_ttl
+            generation: The generation when the call started; the result is dropped if the
+                cache has been invalidated since (None stores it unconditionally)
+        """
+        if generation is not None and generation != self._generation:
+            return
+        ttl = self.static_ttl if static else self.ttl
+        key = self._make_key(name, arguments)
+        self._entries[key] = (time.monotonic() + ttl, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self) -> None:
+        """Drop all cached results and start a new generation."""
+        self._generation += 1
+        self._entries.clear()
@@ -0,0 +1,58 @@
+"""Unit tests for coalescing mod calls into batches."""
+
+import asyncio
+import threading
+import unittest
+
+from src.call_batcher import McpCallBatcher
+from src.models.response import Response
+
+
+class _FakeClient:
+    """Answers calls without a mod; single calls block until released."""
+
+    def __init__(self):
+        self.sent = []
+        self.release = threading.Event()
+
+    def call_with_retry(self, method, params):
+        self.sent.append(method)
+        self.release.wait(2.0)
+        return Response(id=1, result=method)
+
+    def call_batch(self, calls):
+        self.sent.append([method for method, _ in calls])
+        return [Response(id=i, result=method) for i, (method, _) in enumerate(calls)]
+
+
+class TestMcpCallBatcher(unittest.TestCase):
+    """Test cases for McpCallBatcher."""
+
+    def test_lone_call_does_not_wait_for_the_window(self):
+        """With nothing in flight, a call is sent at once rather than after max_wait."""
+        client = _FakeClient()
+        client.release.set()
+        batcher = McpCallBatcher(client, max_wait=5.0)
+        result = asyncio.run(asyncio.wait_for(batcher.call("get_player"), timeout=1.0))
+        self.assertEqual((client.sent, result.result), (["get_player"], "get_player"))
+
+    def test_calls_behind_an_in_flight_send_share_a_batch(self):
+        """Calls made while a send is in flight go out together once it finishes."""
+        client = _FakeClient()
+        batcher = McpCallBatcher(client, max_wait=5.0)
+
+        async def run():
+            first = asyncio.create_task(batcher.call("get_player"))
+            await asyncio.sleep(0.05)
+            queued = [asyncio.create_task(batcher.call(method)) for method in ("list_npcs", "list_items")]
+            await asyncio.sleep(0.05)
+            client.release.set()
+            return await asyncio.wait_for(asyncio.gather(first, *queued), timeout=1.0)
+
+        results = asyncio.run(run())
+        self.assertEqual(client.sent, ["get_player", ["list_npcs", "list_items"]])
+        self.assertEqual([response.result for response in results], ["get_player", "list_npcs", "list_items"])
+
+
+if __name__ == "__main__":
+    unittest.main()
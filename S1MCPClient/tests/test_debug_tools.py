@@ -0,0 +1,95 @@
+"""Unit tests for the debug tools' argument handling and batch execution."""
+
+import asyncio
+import json
+import unittest
+
+from src.models.response import ErrorResponse, Response
+from src.tcp_client import tcp_client_ctx
+from src.tools.debug_tools import _RPC_TOOLS, TOOL_HANDLERS, _build_params
+
+
+class _FakeClient:
+    """Records calls and answers them without a mod."""
+
+    def __init__(self, supports_batch: bool = True):
+        self.supports_batch = supports_batch
+        self.calls = []
+
+    def call_batch(self, calls):
+        self.calls.append(("batch", calls))
+        if not self.supports_batch:
+            error = ErrorResponse(code=-32601, message="Method 'batch' not found")
+            return [Response(id=0, error=error) for _ in calls]
+        return [Response(id=i, result={"method": method}) for i, (method, _) in enumerate(calls)]
+
+    def call_with_retry(self, method, params):
+        self.calls.append((method, params))
+        return Response(id=1, result={"method": method})
+
+
+OPERATIONS = [
+    {"tool": "s1_list_components", "arguments": {"object_name": "Player"}},
+    {"tool": "s1_not_a_tool"},
+    {"tool": "s1_inspect_object", "arguments": {}},
+    {"tool": "s1_find_objects_by_type", "arguments": {"component_type": "NPC"}},
+]
+
+
+class TestBuildParams(unittest.TestCase):
+    """Test cases for building mod params from debug tool arguments."""
+
+    def test_empty_string_is_a_valid_value_to_write(self):
+        """Values being written may be "", 0 or False; only None counts as missing."""
+        for value in ("", 0, False):
+            params = _build_params(_RPC_TOOLS["s1_set_field"], {"object_name": "Player", "field_name": "Name", "value": value})
+            self.assertEqual(params, {"object_name": "Player", "field_name": "Name", "value": value})
+        params = _build_params(_RPC_TOOLS["s1_set_active"], {"object_name": "Player", "active": False})
+        self.assertEqual(params, {"object_name": "Player", "active": False})
+        params = _build_params(_RPC_TOOLS["s1_set_component_property"], {"object_name": "Player", "property_name": "Name"})
+        self.assertEqual(params, "Error: object_name, property_name, and value are required")
+
+    def test_empty_name_counts_as_missing(self):
+        """Names and paths given as "" are rejected like absent ones."""
+        params = _build_params(_RPC_TOOLS["s1_set_field"], {"object_name": "", "field_name": "Name", "value": "x"})
+        self.assertEqual(params, "Error: object_name, field_name, and value are required")
+        params = _build_params(_RPC_TOOLS["s1_list_components"], {"object_name": "", "npc_id": ""})
+        self.assertEqual(params, "Error: either object_name or npc_id is required")
+
+    def test_falsy_optional_arguments_are_forwarded(self):
+        """Optional 0 and False values are sent; None is left out."""
+        params = _build_params(_RPC_TOOLS["s1_get_scene_hierarchy"], {"active_only": False, "max_depth": 0, "scene_name": None})
+        self.assertEqual(params, {"active_only": False, "max_depth": 0})
+
+
+class TestBatchExecute(unittest.TestCase):
+    """Test cases for s1_batch_execute."""
+
+    def _run(self, client):
+        tcp_client_ctx.set(client)
+        content = asyncio.run(TOOL_HANDLERS["s1_batch_execute"]({"operations": OPERATIONS}))
+        return json.loads(content[0].text)
+
+    def test_valid_operations_share_one_batch(self):
+        """Valid operations go to the mod in one batch; invalid ones get errors in place."""
+        client = _FakeClient()
+        results = self._run(client)
+        self.assertEqual(client.calls, [("batch", [
+            ("list_components", {"object_name": "Player"}),
+            ("find_objects_by_type", {"component_type": "NPC"}),
+        ])])
+        self.assertEqual([sorted(entry) for entry in results], [
+            ["result", "tool"], ["error", "tool"], ["error", "tool"], ["result", "tool"],
+        ])
+        self.assertEqual(results[3]["result"], {"method": "find_objects_by_type"})
+
+    def test_falls_back_to_single_calls_without_batch_support(self):
+        """Mods without the batch method get the operations one call at a time."""
+        client = _FakeClient(supports_batch=False)
+        results = self._run(client)
+        self.assertEqual([call[0] for call in client.calls], ["batch", "list_components", "find_objects_by_type"])
+        self.assertEqual(results[0]["result"], {"method": "list_components"})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Unit tests for the tool call latency profiler."""
+
+import unittest
+from unittest import mock
+
+from src.utils.profiler import McpProfiler
+
+
+class TestMcpProfiler(unittest.TestCase):
+    """Test cases for McpProfiler."""
+
+    def test_percentiles_in_milliseconds(self):
+        """Percentiles are computed per tool and stage and reported in milliseconds."""
+        profiler = McpProfiler(report_every=1000)
+        for ms in range(1, 101):
+            profiler.record("s1_get_npc", "handler", 0, ms * 1_000_000)
+
+        stats = profiler.summary()[("s1_get_npc", "handler")]
+        self.assertEqual(stats["count"], 100)
+        self.assertEqual(stats["p50"], 51.0)
+        self.assertEqual(stats["p99"], 100.0)
+
+    def test_report_every_n_calls_clears_samples(self):
+        """A report is logged every report_every calls and covers only the calls since the last one."""
+        profiler = McpProfiler(report_every=2)
+        with mock.patch.object(profiler, "report", wraps=profiler.report) as report:
+            for _ in range(4):
+                profiler.record("s1_list_npcs", "total", 0, 1000)
+                profiler.call_finished()
+        self.assertEqual(report.call_count, 2)
+        self.assertEqual(profiler.summary(), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
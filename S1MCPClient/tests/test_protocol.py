@@ -0,0 +1,61 @@
+"""Unit tests for the length-prefixed JSON protocol."""
+
+import struct
+import unittest
+from unittest import mock
+
+from src import protocol
+from src.protocol import ProtocolError, create_request, decode_response, deserialize_response, encode_request, serialize_request
+
+
+def _frame(body: bytes) -> bytes:
+    return struct.pack('<I', len(body)) + body
+
+
+class TestProtocol(unittest.TestCase):
+    """Test cases for request serialization and response deserialization."""
+
+    def test_serialize_request_with_and_without_orjson(self):
+        """Both JSON backends produce the same compact message."""
+        request = create_request(7, "get_npc", {"npc_id": "kyle", "name": "é"})
+        expected = _frame('{"id":7,"method":"get_npc","params":{"npc_id":"kyle","name":"é"}}'.encode('utf-8'))
+        self.assertEqual(serialize_request(request), expected)
+        with mock.patch.object(protocol, "orjson", None):
+            self.assertEqual(serialize_request(request), expected)
+
+    def test_encode_request_with_integer_beyond_64_bits(self):
+        """Integers orjson can't encode fall back to the standard library instead of failing."""
+        expected = _frame(b'{"id":1,"method":"call_method","params":{"parameters":[1180591620717411303424]}}')
+        for orjson in (protocol.orjson, None):
+            with mock.patch.object(protocol, "orjson", orjson):
+                self.assertEqual(encode_request(1, "call_method", {"parameters": [2**70]}), expected)
+
+    def test_deserialize_response_with_and_without_orjson(self):
+        """Responses decode the same with either JSON backend."""
+        data = _frame(b'{"id":3,"result":{"name":"\xc3\xa9"}}')
+        for orjson in (protocol.orjson, None):
+            with mock.patch.object(protocol, "orjson", orjson):
+                response = deserialize_response(data)
+                self.assertEqual(response.id, 3)
+                self.assertEqual(response.result, {"name": "é"})
+                self.assertIsNone(response.error)
+
+    def test_decode_response_accepts_buffer_views(self):
+        """Payloads read into reused buffers decode without copying them first."""
+        buffer = bytearray(b'{"id":4,"result":[1,2]}    ')
+        for orjson in (protocol.orjson, None):
+            with mock.patch.object(protocol, "orjson", orjson):
+                response = decode_response(memoryview(buffer)[:23])
+                self.assertEqual((response.id, response.result), (4, [1, 2]))
+
+    def test_invalid_payload_raises_protocol_error(self):
+        """Malformed JSON and invalid UTF-8 are reported as ProtocolError."""
+        for orjson in (protocol.orjson, None):
+            with mock.patch.object(protocol, "orjson", orjson):
+                for body in (b'{nope', b'"\xff"'):
+                    with self.assertRaises(ProtocolError):
+                        deserialize_response(_frame(body))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,23 @@
+"""Unit tests for tool result formatting."""
+
+import unittest
+from unittest import mock
+
+from src.utils import result_format
+from src.utils.result_format import format_result
+
+
+class TestFormatResult(unittest.TestCase):
+    """Test cases for format_result."""
+
+    def test_same_text_with_and_without_orjson(self):
+        """Both JSON backends produce the same compact text, with non-ASCII left as is."""
+        result = {"name": "Kyle Cooley", "position": {"x": 1.5, "y": -2, "z": 0}, "tags": ["é", None, True]}
+        expected = '{"name":"Kyle Cooley","position":{"x":1.5,"y":-2,"z":0},"tags":["é",null,true]}'
+        for orjson in (result_format.orjson, None):
+            with mock.patch.object(result_format, "orjson", orjson):
+                self.assertEqual(format_result(result), expected)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,27 @@
+"""Unit tests for the generated tool argument validators."""
+
+import unittest
+
+from mcp.types import Tool
+
+from src import main
+
+
+@unittest.skipIf(main.fastjsonschema is None, "fastjsonschema is not installed")
+class TestSchemaValidators(unittest.TestCase):
+    """Test cases for _compile_schema_validators."""
+
+    def test_validation_leaves_arguments_unchanged(self):
+        """Schema defaults are not written into the arguments being validated."""
+        tool = Tool(
+            name="s1_get_scene_hierarchy",
+            description="",
+            inputSchema={"type": "object", "properties": {"max_depth": {"type": "integer", "default": 10}}},
+        )
+        arguments = {}
+        main._compile_schema_validators((tool,))[tool.name](arguments)
+        self.assertEqual(arguments, {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+"""Unit tests for the TCP client's message framing."""
+
+import socket
+import threading
+import unittest
+
+from src.tcp_client import TcpClient, TcpConnectionError
+
+
+def _frame(body: bytes) -> bytes:
+    return len(body).to_bytes(4, 'little') + body
+
+
+class TestTcpClientFraming(unittest.TestCase):
+    """Test cases for reading framed messages from the mod."""
+
+    def setUp(self):
+        self.client = TcpClient(timeout=2.0)
+        self.client._socket, self.server = socket.socketpair()
+        self.client._socket.settimeout(2.0)
+
+    def tearDown(self):
+        self.client._socket.close()
+        self.server.close()
+
+    def _send_in_pieces(self, *pieces: bytes) -> threading.Thread:
+        """Send each piece as a separate write from another thread."""
+        def send():
+            for piece in pieces:
+                self.server.sendall(piece)
+                threading.Event().wait(0.02)
+        thread = threading.Thread(target=send)
+        thread.start()
+        return thread
+
+    def test_split_length_prefix_is_reassembled(self):
+        """A length prefix arriving in several reads is not treated as a disconnect."""
+        body = b'{"id":1,"result":null}'
+        prefix = _frame(body)[:4]
+        thread = self._send_in_pieces(prefix[:1], prefix[1:3], prefix[3:] + body[:5], body[5:])
+        self.assertEqual(bytes(self.client._read_message()), body)
+        thread.join()
+
+    def test_closed_during_length_prefix_raises(self):
+        """A connection closed mid-prefix raises TcpConnectionError."""
+        self.server.sendall(b'\x10\x00')
+        self.server.close()
+        with self.assertRaises(TcpConnectionError):
+            self.client._read_message()
+
+    def test_call_skips_queued_server_heartbeats(self):
+        """Heartbeats the mod sent while the client was idle are read past, however many there are."""
+        self.client._connected = True
+        self.client._request_ids = iter([5])
+        for heartbeat_id in (1, 5):
+            self.server.sendall(_frame(b'{"id":%d,"result":{"type":"server_heartbeat","status":"alive"}}' % heartbeat_id))
+        self.server.sendall(_frame(b'{"id":5,"result":{"name":"Kyle"}}'))
+        response = self.client.call("get_npc", {"npc_id": "kyle"})
+        self.assertEqual((response.id, response.result), (5, {"name": "Kyle"}))
+
+
+    def test_unencodable_params_keep_the_connection(self):
+        """Params that can't be encoded fail the call without dropping the connection."""
+        self.client._connected = True
+        with self.assertRaises(TypeError):
+            self.client.call("call_method", {"parameters": [object()]})
+        self.assertTrue(self.client._connected)
+
+if __name__ == "__main__":
+    unittest.main()
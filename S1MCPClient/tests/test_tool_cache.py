@@ -0,0 +1,72 @@
+"""Unit tests for the read-only tool call cache."""
+
+import unittest
+from unittest import mock
+
+from src.utils.tool_cache import ToolCallCacher
+
+
+class TestToolCallCacher(unittest.TestCase):
+    """Test cases for ToolCallCacher."""
+
+    def test_hit_ignores_argument_order(self):
+        """Identical arguments in a different order hit the same entry."""
+        cache = ToolCallCacher(ttl=10.0)
+        cache.put("s1_get_npc", {"npc_id": "kyle", "extra": 1}, ["result"])
+        self.assertEqual(cache.get("s1_get_npc", {"extra": 1, "npc_id": "kyle"}), ["result"])
+        self.assertIsNone(cache.get("s1_get_npc", {"npc_id": "other"}))
+
+    def test_expired_entry_is_dropped(self):
+        """Entries older than the TTL are not returned."""
+        cache = ToolCallCacher(ttl=1.0)
+        with mock.patch("src.utils.tool_cache.time.monotonic", return_value=100.0):
+            cache.put("s1_list_npcs", None, ["result"])
+        with mock.patch("src.utils.tool_cache.time.monotonic", return_value=101.5):
+            self.assertIsNone(cache.get("s1_list_npcs", None))
+
+    def test_static_entry_outlives_ttl(self):
+        """Entries stored as static stay valid for static_ttl instead of ttl."""
+        cache = ToolCallCacher(ttl=1.0, static_ttl=60.0)
+        with mock.patch("src.utils.tool_cache.time.monotonic", return_value=100.0):
+            cache.put("s1_inspect_type", {"type_name": "NPC"}, ["result"], static=True)
+        with mock.patch("src.utils.tool_cache.time.monotonic", return_value=130.0):
+            self.assertEqual(cache.get("s1_inspect_type", {"type_name": "NPC"}), ["result"])
+        with mock.patch("src.utils.tool_cache.time.monotonic", return_value=160.0):
+            self.assertIsNone(cache.get("s1_inspect_type", {"type_name": "NPC"}))
+
+    def test_invalidate_clears_entries(self):
+        """invalidate() drops every cached result."""
+        cache = ToolCallCacher(ttl=10.0)
+        cache.put("s1_list_npcs", {}, ["result"])
+        cache.invalidate()
+        self.assertIsNone(cache.get("s1_list_npcs", {}))
+
+    def test_put_after_invalidate_is_dropped(self):
+        """A read that started before a write doesn't cache its result once the write invalidated."""
+        cache = ToolCallCacher(ttl=10.0)
+        generation = cache.generation
+        cache.invalidate()
+        cache.put("s1_get_npc_position", {"npc_id": "kyle"}, ["before"], generation=generation)
+        self.assertIsNone(cache.get("s1_get_npc_position", {"npc_id": "kyle"}))
+        cache.put("s1_get_npc_position", {"npc_id": "kyle"}, ["after"], generation=cache.generation)
+        self.assertEqual(cache.get("s1_get_npc_position", {"npc_id": "kyle"}), ["after"])
+
+    def test_size_is_capped_least_recently_used_first(self):
+        """Past max_entries, the least recently used entry is evicted."""
+        cache = ToolCallCacher(ttl=10.0, max_entries=2)
+        cache.put("s1_get_npc", {"npc_id": "a"}, ["a"])
+        cache.put("s1_get_npc", {"npc_id": "b"}, ["b"])
+        self.assertEqual(cache.get("s1_get_npc", {"npc_id": "a"}), ["a"])
+        cache.put("s1_get_npc", {"npc_id": "c"}, ["c"])
+        self.assertEqual(len(cache._entries), 2)
+        self.assertIsNone(cache.get("s1_get_npc", {"npc_id": "b"}))
+        self.assertEqual(cache.get("s1_get_npc", {"npc_id": "a"}), ["a"])
+        self.assertEqual(cache.get("s1_get_npc", {"npc_id": "c"}), ["c"])
+
+    def test_zero_ttl_disables(self):
+        """A TTL of 0 turns the cache off."""
+        self.assertFalse(ToolCallCacher(ttl=0).enabled)
+
+
+if __name__ == "__main__":
+    unittest.main()
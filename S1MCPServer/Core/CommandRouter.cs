@@ -30,6 +30,7 @@ public class CommandRouter
         _handlers["handshake"] = new HandshakeCommandHandler(_responseQueue, this);
         _handlers["list_methods"] = new HandshakeCommandHandler(_responseQueue, this);
         _handlers["heartbeat"] = new HandshakeCommandHandler(_responseQueue, this);
+        _handlers["batch"] = new BatchCommandHandler(_responseQueue);
         
         // Phase 2 handlers
         _handlers["get_npc"] = new NPCCommandHandler(_responseQueue);
@@ -0,0 +1,113 @@
+using System.Collections.Generic;
+using System.Text.Json;
+using S1MCPServer.Core;
+using S1MCPServer.Models;
+using S1MCPServer.Utils;
+
+namespace S1MCPServer.Handlers;
+
+/// <summary>
+/// Handles batch requests: runs several requests in one round-trip and returns all of their responses.
+/// </summary>
+public class BatchCommandHandler : ICommandHandler
+{
+    private const int MaxBatchSize = 50;
+
+    private readonly ResponseQueue _responseQueue;
+    private readonly ResponseQueue _batchResponses = new();
+    private CommandRouter? _batchRouter;
+
+    public BatchCommandHandler(ResponseQueue responseQueue)
+    {
+        _responseQueue = responseQueue;
+    }
+
+    public void Handle(Request request)
+    {
+        if (request.Params == null
+            || !request.Params.TryGetValue("requests", out var requestsObj)
+            || requestsObj is not JsonElement { ValueKind: JsonValueKind.Array } requests)
+        {
+            var errorResponse = ProtocolHandler.CreateErrorResponse(
+                request.Id,
+                -32602, // Invalid params
+                "requests parameter is required and must be an array"
+            );
+            _responseQueue.EnqueueResponse(errorResponse);
+            return;
+        }
+
+        int count = requests.GetArrayLength();
+        if (count > MaxBatchSize)
+        {
+            var errorResponse = ProtocolHandler.CreateErrorResponse(
+                request.Id,
+                -32602, // Invalid params
+                $"Batch too large: {count} requests (max {MaxBatchSize})"
+            );
+            _responseQueue.EnqueueResponse(errorResponse);
+            return;
+        }
+
+        // Sub-requests are routed through a dedicated router whose handlers write into
+        // _batchResponses, so their responses can be collected instead of sent individually
+        _batchRouter ??= new CommandRouter(_batchResponses);
+
+        ModLogger.Debug($"Handling batch of {count} request(s) (ID: {request.Id})");
+        var responses = new List<Response>(count);
+        int index = 0;
+        foreach (var element in requests.EnumerateArray())
+        {
+            responses.Add(RunBatchEntry(element, index));
+            index++;
+        }
+
+        var result = new Dictionary<string, object>
+        {
+            ["responses"] = responses
+        };
+        _responseQueue.EnqueueResponse(ProtocolHandler.CreateSuccessResponse(request.Id, result));
+    }
+
+    private Response RunBatchEntry(JsonElement element, int index)
+    {
+        Request entry;
+        try
+        {
+            entry = ProtocolHandler.DeserializeRequest(element.GetRawText());
+        }
+        catch (Exception ex)
+        {
+            return ProtocolHandler.CreateErrorResponse(
+                index,
+                -32600, // Invalid Request
+                "Invalid batch entry",
+                new { details = ex.Message }
+            );
+        }
+
+        if (entry.Method == "batch")
+        {
+            return ProtocolHandler.CreateErrorResponse(
+                entry.Id,
+                -32600, // Invalid Request
+                "Nested batch requests are not supported"
+            );
+        }
+
+        _batchResponses.Clear();
+        _batchRouter!.RouteCommand(entry);
+
+        if (_batchResponses.TryDequeue(out Response? response) && response != null)
+        {
+            return response;
+        }
+
+        ModLogger.Warn($"Batch entry {entry.Method} (ID: {entry.Id}) produced no response");
+        return ProtocolHandler.CreateErrorResponse(
+            entry.Id,
+            -32603, // Internal error
+            $"No response produced for '{entry.Method}'"
+        );
+    }
+}
@@ -92,7 +92,7 @@ public class HandshakeCommandHandler : ICommandHandler
                 {
                     methodCategories["debug"].Add(method);
                 }
-                else if (method == "handshake" || method == "list_methods")
+                else if (method == "handshake" || method == "list_methods" || method == "batch")
                 {
                     methodCategories["system"].Add(method);
                 }